@@ -6,16 +6,24 @@ Shared base classes for both tools:
 - Tool 2: Municipal Opportunity Finder
 """
 
-import math
+import bisect
 import hashlib
 import asyncio
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 import json
 import os
+import sys
+import threading
+import time
+
+import orjson
+
+from core.geo import haversine_a, haversine_m
 
 
 class HabitatGrade(Enum):
@@ -34,13 +42,16 @@ class HabitatGrade(Enum):
     
     @classmethod
     def from_score(cls, score: float) -> 'HabitatGrade':
-        for grade in cls:
-            if score >= grade.min_score:
-                return grade
-        return cls.F
+        idx = bisect.bisect_right(_GRADE_THRESHOLDS, score) - 1
+        return _GRADES_ASC[idx] if idx >= 0 else cls.F
+
 
+# Built once at import; from_score bisects instead of iterating the Enum
+_GRADES_ASC = sorted(HabitatGrade, key=lambda g: g.min_score)
+_GRADE_THRESHOLDS = [g.min_score for g in _GRADES_ASC]
 
-@dataclass
+
+@dataclass(slots=True)
 class Location:
     """Geographic location with privacy-preserving grid hash."""
     lat: float
@@ -56,24 +67,31 @@ class Location:
     def _compute_grid_hash(self, precision: int = 3) -> str:
         grid_lat = round(self.lat, precision)
         grid_lng = round(self.lng, precision)
-        return f"{grid_lat}_{grid_lng}"
+        # Many locations share a cell; interning makes them share one str
+        return sys.intern(f"{grid_lat}_{grid_lng}")
     
     def distance_to(self, other: 'Location') -> float:
-        R = 6371000
-        phi1 = math.radians(self.lat)
-        phi2 = math.radians(other.lat)
-        delta_phi = math.radians(other.lat - self.lat)
-        delta_lambda = math.radians(other.lng - self.lng)
-        a = (math.sin(delta_phi/2)**2 + 
-             math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda/2)**2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        return R * c
+        return float(haversine_m(self.lat, self.lng, other.lat, other.lng))
+    
+    def _haversine_a(self, other: 'Location') -> float:
+        return float(haversine_a(self.lat, self.lng, other.lat, other.lng))
+    
+    def distance_rank_key(self, other: 'Location') -> float:
+        """
+        Sort/threshold key for distance to other - NOT meters.
+        
+        Returns the haversine 'a' term, which is monotonic in distance, so
+        ordering and radius checks match distance_to without the sqrt and
+        atan2 (Sinnott; SimSIMD geospatial). Compare against
+        core.geo.radius_to_a(radius_m); use distance_to for display.
+        """
+        return self._haversine_a(other)
     
     def to_dict(self) -> Dict:
         return {"lat": self.lat, "lng": self.lng, "name": self.name, "grid_hash": self.grid_hash}
 
 
-@dataclass
+@dataclass(slots=True)
 class FactorResult:
     """Result from a single scoring factor"""
     name: str
@@ -93,7 +111,7 @@ class FactorResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Recommendation:
     """Actionable recommendation for habitat improvement"""
     priority: str
@@ -107,7 +125,7 @@ class Recommendation:
                 "reason": self.reason, "impact": self.impact, "species": self.species}
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoringResult:
     """Complete scoring result for a location"""
     location: Location
@@ -135,43 +153,67 @@ class ScoringResult:
             "algorithm": self.algorithm, "tool": self.tool,
             "timestamp": self.timestamp, "metadata": self.metadata
         }
+    
+    def to_json(self) -> bytes:
+        return orjson.dumps(self.to_dict())
 
 
 class CacheManager:
-    """In-memory cache with TTL for API responses."""
+    """
+    In-memory LRU cache with TTL for API responses.
+    
+    get() is lock-free: single OrderedDict ops are GIL-atomic and it
+    tolerates an entry vanishing between them. Multi-step writes
+    (evict + insert, expiry, clear) hold _write_lock.
+    """
     
     def __init__(self, ttl_hours: int = 24, max_entries: int = 1000):
         self.ttl_hours = ttl_hours
+        self._ttl_seconds = ttl_hours * 3600.0
         self.max_entries = max_entries
-        self._cache: Dict[str, Dict] = {}
+        self._cache: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        self._write_lock = threading.Lock()
         self.stats = {"hits": 0, "misses": 0, "evictions": 0}
     
-    def _make_key(self, source: str, grid_hash: str) -> str:
-        return f"{source}:{grid_hash}"
+    def _make_key(self, source: str, grid_hash: str) -> Tuple[str, str]:
+        return (source, grid_hash)
     
     def get(self, source: str, location: Location) -> Optional[Dict]:
         key = self._make_key(source, location.grid_hash)
-        if key in self._cache:
-            entry = self._cache[key]
-            age = datetime.utcnow() - entry["timestamp"]
-            if age < timedelta(hours=self.ttl_hours):
+        entry = self._cache.get(key)
+        if entry is not None:
+            if time.monotonic() - entry["timestamp"] < entry["ttl"]:
+                try:
+                    self._cache.move_to_end(key)
+                except KeyError:
+                    pass  # evicted by a concurrent writer; data is still valid
                 self.stats["hits"] += 1
                 return entry["data"]
-            else:
-                del self._cache[key]
+            with self._write_lock:
+                if self._cache.get(key) is entry:
+                    del self._cache[key]
         self.stats["misses"] += 1
         return None
     
-    def set(self, source: str, location: Location, data: Dict):
-        if len(self._cache) >= self.max_entries:
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k]["timestamp"])
-            del self._cache[oldest_key]
-            self.stats["evictions"] += 1
+    def set(self, source: str, location: Location, data: Dict, ttl_seconds: Optional[float] = None):
+        """Store data; ttl_seconds overrides the cache-wide TTL for this entry."""
         key = self._make_key(source, location.grid_hash)
-        self._cache[key] = {"data": data, "timestamp": datetime.utcnow()}
+        entry = {
+            "data": data,
+            "timestamp": time.monotonic(),
+            "ttl": self._ttl_seconds if ttl_seconds is None else ttl_seconds,
+        }
+        with self._write_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif len(self._cache) >= self.max_entries:
+                self._cache.popitem(last=False)
+                self.stats["evictions"] += 1
+            self._cache[key] = entry
     
     def clear(self):
-        self._cache.clear()
+        with self._write_lock:
+            self._cache.clear()
     
     def get_stats(self) -> Dict:
         total = self.stats["hits"] + self.stats["misses"]
@@ -238,10 +280,12 @@ class ScoringAlgorithm(ABC):
 class PollinatorEngine:
     """Main scoring engine - orchestrates sources, factors, and algorithms."""
     
-    def __init__(self, cache_ttl_hours: int = 24):
+    def __init__(self, cache_ttl_hours: int = 24, error_ttl_seconds: int = 300):
         self._sources: Dict[str, DataSource] = {}
         self._algorithms: Dict[str, ScoringAlgorithm] = {}
         self._cache = CacheManager(ttl_hours=cache_ttl_hours)
+        self._error_ttl_seconds = error_ttl_seconds
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
     
     def register_source(self, source: DataSource):
         self._sources[source.name] = source
@@ -255,23 +299,39 @@ class PollinatorEngine:
     def list_algorithms(self) -> List[str]:
         return list(self._algorithms.keys())
     
+    async def _fetch_uncached(self, source_name: str, location: Location) -> Dict[str, Any]:
+        try:
+            result = await self._sources[source_name].fetch(location)
+            self._cache.set(source_name, location, result)
+            return result
+        except Exception as e:
+            # Cache failures briefly so a source that keeps erroring for this
+            # grid cell isn't refetched on every call
+            result = {"error": str(e)}
+            self._cache.set(source_name, location, result, ttl_seconds=self._error_ttl_seconds)
+            return result
+    
+    async def _fetch_one(self, source_name: str, location: Location) -> Tuple[str, Dict[str, Any]]:
+        cached = self._cache.get(source_name, location)
+        if cached is not None:
+            return source_name, cached
+        # Coalesce concurrent misses for the same cell (e.g. batch_score over
+        # a dense neighborhood) into one upstream fetch
+        key = (source_name, location.grid_hash)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_uncached(source_name, location))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return source_name, await asyncio.shield(task)
+    
     async def fetch_data(self, location: Location, sources: List[str] = None) -> Dict[str, Any]:
         sources = sources or list(self._sources.keys())
         data = {"_location": location}
-        for source_name in sources:
-            source = self._sources.get(source_name)
-            if not source:
-                continue
-            cached = self._cache.get(source_name, location)
-            if cached is not None:
-                data[source_name] = cached
-                continue
-            try:
-                result = await source.fetch(location)
-                data[source_name] = result
-                self._cache.set(source_name, location, result)
-            except Exception as e:
-                data[source_name] = {"error": str(e)}
+        results = await asyncio.gather(
+            *(self._fetch_one(name, location) for name in sources if name in self._sources)
+        )
+        data.update(results)
         return data
     
     async def score(self, location: Location, algorithm: str = "homeowner_v1") -> ScoringResult:
@@ -281,12 +341,15 @@ class PollinatorEngine:
         data = await self.fetch_data(location)
         return algo.calculate(location, data)
     
-    async def batch_score(self, locations: List[Location], algorithm: str = "homeowner_v1") -> List[ScoringResult]:
-        results = []
-        for loc in locations:
-            result = await self.score(loc, algorithm)
-            results.append(result)
-        return results
+    async def batch_score(self, locations: List[Location], algorithm: str = "homeowner_v1",
+                          concurrency: int = 16) -> List[ScoringResult]:
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def _one(loc: Location) -> ScoringResult:
+            async with sem:
+                return await self.score(loc, algorithm)
+        
+        return list(await asyncio.gather(*(_one(loc) for loc in locations)))
     
     def get_cache_stats(self) -> Dict:
         return self._cache.get_stats()
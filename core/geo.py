@@ -0,0 +1,77 @@
+"""
+Utah Pollinator Path - Geo Helpers
+==================================
+Vectorized great-circle math shared by the engine.
+All functions accept scalars or NumPy arrays and broadcast.
+"""
+
+import math
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371000.0
+
+
+def haversine_a(lat1, lng1, lat2, lng2):
+    """
+    Haversine 'a' term: sin² of half the central angle.
+
+    Monotonic in distance, so it sorts and thresholds exactly like
+    haversine_m while skipping the sqrt + atan2 (Sinnott 1984).
+    Compare against radius_to_a() rather than converting back.
+    """
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dphi = phi2 - phi1
+    dl = np.radians(np.subtract(lng2, lng1))
+    return np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dl / 2) ** 2
+
+
+def radius_to_a(radius_m: float) -> float:
+    """Haversine 'a' threshold equivalent to a radius in meters."""
+    return math.sin(radius_m / (2 * EARTH_RADIUS_M)) ** 2
+
+
+def haversine_m(lat1, lng1, lat2, lng2):
+    """Haversine distance in meters between (lat1, lng1) and (lat2, lng2)."""
+    a = haversine_a(lat1, lng1, lat2, lng2)
+    return EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def haversine_pairwise(points_a: np.ndarray, points_b: np.ndarray) -> np.ndarray:
+    """
+    Distance matrix in meters between two point sets.
+
+    points_a is (N, 2) and points_b is (M, 2), columns ordered (lat, lng).
+    Returns an (N, M) array.
+    """
+    a = np.asarray(points_a, dtype=np.float64)
+    b = np.asarray(points_b, dtype=np.float64)
+    return haversine_m(a[:, None, 0], a[:, None, 1], b[None, :, 0], b[None, :, 1])
+
+
+def within_bbox(lat, lng, lat0: float, lng0: float, radius_m: float):
+    """
+    Boolean mask of points inside the lat/lng box enclosing a radius.
+
+    Four float compares per point - cheap rejection before any trig.
+    The box is a superset of the circle, so it never drops a true match.
+    """
+    ang = radius_m / EARTH_RADIUS_M
+    dlat_max = math.degrees(ang)
+    cos_lat0 = math.cos(math.radians(lat0))
+    if ang >= math.pi / 2 or cos_lat0 <= math.sin(ang):
+        dlng_max = 180.0  # circle reaches a pole
+    else:
+        dlng_max = math.degrees(math.asin(math.sin(ang) / cos_lat0))
+    dlng = np.abs((np.asarray(lng) - lng0 + 180.0) % 360.0 - 180.0)
+    return (np.abs(np.asarray(lat) - lat0) <= dlat_max) & (dlng <= dlng_max)
+
+
+def indices_within_radius(lat, lng, lat0: float, lng0: float, radius_m: float) -> np.ndarray:
+    """Indices of points within radius_m of (lat0, lng0), bbox-filtered first."""
+    lat = np.asarray(lat, dtype=np.float64)
+    lng = np.asarray(lng, dtype=np.float64)
+    idx = np.flatnonzero(within_bbox(lat, lng, lat0, lng0, radius_m))
+    a = haversine_a(lat[idx], lng[idx], lat0, lng0)
+    return idx[a <= radius_to_a(radius_m)]
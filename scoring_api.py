@@ -1,11 +1,36 @@
-from fastapi import FastAPI
+import asyncio
+from bisect import bisect_right
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from heapq import merge
+from operator import itemgetter
+from typing import List, Optional
+import orjson
 import random
+import zlib
+from sortedcontainers import SortedKeyList
 
-app = FastAPI()
+import score_engine
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await score_engine.close_client()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,6 +41,8 @@ app.add_middleware(
 )
 
 user_gardens = {}
+# Same gardens kept ordered by score (highest first) as they register
+_user_leaderboard = SortedKeyList(key=lambda g: -g["score"])
 
 class ScoringRequest(BaseModel):
     latitude: float
@@ -35,6 +62,9 @@ class AddressRequest(BaseModel):
     address: str
     zip: str
 
+class RecalculateRequest(BaseModel):
+    grid_hash: Optional[str] = None
+
 # Mock Utah addresses for demo
 MOCK_ADDRESSES = {
     "84103": {"lat": 40.7608, "lng": -111.8910, "city": "Salt Lake City"},
@@ -44,25 +74,18 @@ MOCK_ADDRESSES = {
     "84070": {"lat": 40.5725, "lng": -111.8584, "city": "Sandy"},
 }
 
+# Lower bounds for each grade/tier above the first; bisect picks the label
+_GRADE_THRESHOLDS = (50, 60, 63, 67, 70, 73, 77, 80, 85, 90)
+_GRADE_LABELS = ("F", "D", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+")
+
+_TIER_THRESHOLDS = (40, 55, 70, 85)
+_TIER_LABELS = ("Seedling", "Growing", "Bee Friendly", "Habitat Hero", "Pollinator Champion")
+
 def score_to_grade(score):
-    if score >= 90: return "A+"
-    if score >= 85: return "A"
-    if score >= 80: return "A-"
-    if score >= 77: return "B+"
-    if score >= 73: return "B"
-    if score >= 70: return "B-"
-    if score >= 67: return "C+"
-    if score >= 63: return "C"
-    if score >= 60: return "C-"
-    if score >= 50: return "D"
-    return "F"
+    return _GRADE_LABELS[bisect_right(_GRADE_THRESHOLDS, score)]
 
 def get_tier(score):
-    if score >= 85: return "Pollinator Champion"
-    if score >= 70: return "Habitat Hero"
-    if score >= 55: return "Bee Friendly"
-    if score >= 40: return "Growing"
-    return "Seedling"
+    return _TIER_LABELS[bisect_right(_TIER_THRESHOLDS, score)]
 
 @app.get("/health")
 def health():
@@ -73,12 +96,13 @@ def geocode_address(req: AddressRequest):
     """Mock geocoding - returns approximate location based on ZIP."""
     if req.zip in MOCK_ADDRESSES:
         loc = MOCK_ADDRESSES[req.zip]
-        # Add slight randomness for different addresses in same ZIP
-        random.seed(hash(req.address))
+        # Add slight randomness for different addresses in same ZIP.
+        # crc32 rather than hash() so every worker/restart agrees.
+        rng = random.Random(zlib.crc32(req.address.encode()))
         return {
             "success": True,
-            "latitude": loc["lat"] + random.uniform(-0.01, 0.01),
-            "longitude": loc["lng"] + random.uniform(-0.01, 0.01),
+            "latitude": loc["lat"] + rng.uniform(-0.01, 0.01),
+            "longitude": loc["lng"] + rng.uniform(-0.01, 0.01),
             "city": loc["city"],
             "address": req.address,
             "zip": req.zip,
@@ -86,67 +110,123 @@ def geocode_address(req: AddressRequest):
         }
     return {"success": False, "error": "ZIP code not in Utah service area"}
 
+# Static shape of /api/score; handlers fill in the numbers. Templates
+# hold only immutable values, since every response shallow-copies them.
+_FACTOR_MAX = {
+    "pollinatorActivity": 25,
+    "septemberGap": 30,
+    "connectivity": 20,
+    "speciesDiversity": 15,
+    "bloomCoverage": 10,
+}
+_FACTOR_TEMPLATES = {
+    name: {"score": 0, "max_score": m, "percentage": 0.0}
+    for name, m in _FACTOR_MAX.items()
+}
+# 100 / max_score, so percentages are one multiply
+_FACTOR_PCT = {name: 100 / m for name, m in _FACTOR_MAX.items()}
+_SCORE_TEMPLATE = {
+    "overall_score": 0,
+    "max_score": 100,
+    "grade": "F",
+    "factors": None,
+    "top_recommendations": None,
+    "nearby_observations": 0,
+    "unique_species": 0,
+    "calculated_at": "",
+    "methodology_version": "1.0.0",
+}
+_SEPT_GAP_RECS = ["Plant fall bloomers"]
+_SEPT_TOP_RECS = ["Plant fall bloomers for September"]
+
+def _factor(name, score, details=None, recommendations=None):
+    return {
+        **_FACTOR_TEMPLATES[name],
+        "score": score,
+        "percentage": round(score * _FACTOR_PCT[name], 1),
+        "details": {} if details is None else details,
+        "recommendations": [] if recommendations is None else recommendations,
+    }
+
 @app.post("/api/score")
 def calculate_score(req: ScoringRequest):
     seed = int((req.latitude * 1000 + req.longitude * 1000) % 10000)
-    random.seed(seed)
-    act_score = random.randint(5, 20)
-    sept_score = random.randint(0, 18)
-    conn_score = random.randint(8, 18)
-    div_score = random.randint(3, 12)
-    bloom_score = random.randint(2, 8)
+    rng = random.Random(seed)
+    act_score = rng.randint(5, 20)
+    sept_score = rng.randint(0, 18)
+    conn_score = rng.randint(8, 18)
+    div_score = rng.randint(3, 12)
+    bloom_score = rng.randint(2, 8)
     overall = act_score + sept_score + conn_score + div_score + bloom_score
+    sept_gap = sept_score < 18
     
     return {
+        **_SCORE_TEMPLATE,
         "overall_score": overall,
-        "max_score": 100,
         "grade": score_to_grade(overall),
         "factors": {
-            "pollinatorActivity": {"score": act_score, "max_score": 25, "percentage": round(act_score/25*100,1), "details": {}, "recommendations": []},
-            "septemberGap": {"score": sept_score, "max_score": 30, "percentage": round(sept_score/30*100,1), "details": {"status": "Severe gap" if sept_score < 12 else "Moderate"}, "recommendations": ["Plant fall bloomers"] if sept_score < 18 else []},
-            "connectivity": {"score": conn_score, "max_score": 20, "percentage": round(conn_score/20*100,1), "details": {}, "recommendations": []},
-            "speciesDiversity": {"score": div_score, "max_score": 15, "percentage": round(div_score/15*100,1), "details": {}, "recommendations": []},
-            "bloomCoverage": {"score": bloom_score, "max_score": 10, "percentage": round(bloom_score/10*100,1), "details": {}, "recommendations": []}
+            "pollinatorActivity": _factor("pollinatorActivity", act_score),
+            "septemberGap": _factor(
+                "septemberGap", sept_score,
+                details={"status": "Severe gap" if sept_score < 12 else "Moderate"},
+                recommendations=list(_SEPT_GAP_RECS) if sept_gap else [],
+            ),
+            "connectivity": _factor("connectivity", conn_score),
+            "speciesDiversity": _factor("speciesDiversity", div_score),
+            "bloomCoverage": _factor("bloomCoverage", bloom_score),
         },
-        "top_recommendations": ["Plant fall bloomers for September"] if sept_score < 18 else [],
-        "nearby_observations": random.randint(10, 100),
-        "unique_species": random.randint(5, 30),
+        "top_recommendations": list(_SEPT_TOP_RECS) if sept_gap else [],
+        "nearby_observations": rng.randint(10, 100),
+        "unique_species": rng.randint(5, 30),
         "calculated_at": datetime.now().isoformat(),
-        "methodology_version": "1.0.0"
     }
 
-@app.get("/api/leaderboard")
-def get_leaderboard(city: str = "Murray"):
-    random.seed(42)
+def _mock_gardens():
+    """The fixed demo gardens (seeded, so identical on every run)."""
+    rng = random.Random(42)
     neighborhoods = ["Liberty", "Hillcrest", "Fashion Place", "Vine Street", "Woodstock"]
     gardens = []
     for i in range(24):
-        score = random.randint(30, 95)
+        score = rng.randint(30, 95)
         gardens.append({
             "id": f"garden-{i+1:03d}",
             "anonymousId": f"Garden #{i+1}",
-            "city": city,
-            "neighborhood": random.choice(neighborhoods),
+            "city": None,
+            "neighborhood": rng.choice(neighborhoods),
             "score": score,
             "verifiedScore": score,
             "tier": get_tier(score),
-            "plantCount": random.randint(5, 40),
-            "nativePlantCount": random.randint(3, 25),
-            "fallBloomerCount": random.randint(0, 10),
-            "observationCount": random.randint(0, 50),
-            "referralCount": random.randint(0, 5),
-            "verificationLevel": random.choice(["unverified", "community", "professional"]),
-            "registeredAt": f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
+            "plantCount": rng.randint(5, 40),
+            "nativePlantCount": rng.randint(3, 25),
+            "fallBloomerCount": rng.randint(0, 10),
+            "observationCount": rng.randint(0, 50),
+            "referralCount": rng.randint(0, 5),
+            "verificationLevel": rng.choice(["unverified", "community", "professional"]),
+            "registeredAt": f"2024-{rng.randint(1,12):02d}-{rng.randint(1,28):02d}",
             "isCurrentUser": False
         })
-    for g in user_gardens.values():
-        gardens.append(g)
-    gardens.sort(key=lambda x: x["score"], reverse=True)
+    return tuple(gardens)
+
+_BASE_LEADERBOARD = _mock_gardens()
+
+@lru_cache(maxsize=32)
+def _city_leaderboard(city):
+    gardens = sorted(({**g, "city": city} for g in _BASE_LEADERBOARD), key=itemgetter("score"), reverse=True)
+    return tuple(gardens)
+
+@app.get("/api/leaderboard")
+def get_leaderboard(city: str = "Murray"):
+    # Both sides are already ordered; merge instead of re-sorting
+    gardens = list(merge(_city_leaderboard(city), _user_leaderboard, key=itemgetter("score"), reverse=True))
     return {"city": city, "gardens": gardens}
 
 @app.post("/api/garden/register")
 def register_garden(garden: GardenData):
     garden_id = f"garden-user-{len(user_gardens) + 1:03d}"
+    native = fall = 0
+    for p in garden.plants:
+        native += bool(p.get("native", False))
+        fall += "fall" in str(p.get("season", ""))
     user_gardens[garden_id] = {
         "id": garden_id,
         "anonymousId": garden.name,
@@ -158,14 +238,15 @@ def register_garden(garden: GardenData):
         "verifiedScore": garden.score,
         "tier": get_tier(garden.score),
         "plantCount": len(garden.plants),
-        "nativePlantCount": len([p for p in garden.plants if p.get("native", False)]),
-        "fallBloomerCount": len([p for p in garden.plants if "fall" in str(p.get("season", ""))]),
+        "nativePlantCount": native,
+        "fallBloomerCount": fall,
         "observationCount": 0,
         "referralCount": 0,
         "verificationLevel": "unverified",
         "registeredAt": datetime.now().strftime("%Y-%m-%d"),
         "isCurrentUser": True
     }
+    _user_leaderboard.add(user_gardens[garden_id])
     return {"success": True, "gardenId": garden_id, "garden": user_gardens[garden_id]}
 
 @app.get("/api/garden/mine")
@@ -174,6 +255,45 @@ def get_my_garden():
         return {"garden": list(user_gardens.values())[-1]}
     return {"garden": None}
 
+def bearer_token(authorization: str = Header("")):
+    """Token from an 'Authorization: Bearer <token>' header, or None."""
+    if not authorization.startswith("Bearer "):
+        return None
+    return authorization.split(" ")[1]
+
+def _auth_error(message):
+    return ORJSONResponse({"error": message}, status_code=401)
+
+@app.get("/api/scores/my")
+async def get_my_score(grid_hash: Optional[str] = None, token: Optional[str] = Depends(bearer_token)):
+    """Get current user's stored score."""
+    if token is None:
+        return _auth_error("Authorization required")
+    user_id = await score_engine.get_user_id(token)
+    if user_id is None:
+        return _auth_error("Invalid token")
+    score, history = await asyncio.gather(
+        score_engine.get_stored_score(user_id, grid_hash, token),
+        score_engine.get_score_history(user_id, grid_hash, token, limit=10),
+    )
+    return {"score": score, "history": history}
+
+@app.post("/api/scores/recalculate")
+async def recalculate_my_score(req: Optional[RecalculateRequest] = None, token: Optional[str] = Depends(bearer_token)):
+    """Force recalculate current user's score."""
+    if token is None:
+        return _auth_error("Authorization required")
+    user_id = await score_engine.get_user_id(token)
+    if user_id is None:
+        return _auth_error("Invalid token")
+    grid_hash = req.grid_hash if req else None
+    return await score_engine.recalculate_and_store_score(user_id, grid_hash, token, source='manual')
+
+@app.get("/api/scores/leaderboard")
+async def score_leaderboard(grid_hash: Optional[str] = None, limit: int = 20):
+    """Get score leaderboard."""
+    return {"leaderboard": await score_engine.get_leaderboard(grid_hash, limit)}
+
 if __name__ == "__main__":
     import uvicorn
     print("🐝 BeehiveConnect API (Mock Mode)")
@@ -5,6 +5,10 @@ Dynamic weights and versioning for model validation.
 Change weights here to test different models.
 """
 
+from types import MappingProxyType
+
+import numpy as np
+
 # Current active model version
 ACTIVE_MODEL_VERSION = "2.0.0"
 
@@ -162,9 +166,75 @@ SCORING_MODELS = {
 }
 
 
+def _freeze(obj):
+    """Read-only deep copy: dicts become MappingProxyType, lists tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+# Active model resolved once at import; scoring reads these directly
+_EMPTY = MappingProxyType({})
+_ACTIVE = _freeze(SCORING_MODELS.get(ACTIVE_MODEL_VERSION, SCORING_MODELS["2.0.0"]))
+
+_FLORAL_CFG = _ACTIVE.get("floral_config", _EMPTY)
+_NESTING_CFG = _ACTIVE.get("nesting_config", _EMPTY)
+_CONNECTIVITY_CFG = _ACTIVE.get("connectivity_config", _EMPTY)
+_MANAGEMENT_CFG = _ACTIVE.get("management_config", _EMPTY)
+
+FALL_POINTS = _FLORAL_CFG.get("fall_points", 6)
+IMPERVIOUS_THRESHOLD_PCT = _ACTIVE.get("impervious_config", _EMPTY).get("threshold_pct")
+
+
+def _compile_tiers(tiers, key):
+    """Tier dicts -> (ascending thresholds, points) arrays for lookup_tier."""
+    ordered = sorted(tiers, key=lambda t: t[key])
+    return (
+        np.array([t[key] for t in ordered], dtype=np.float64),
+        np.array([t["points"] for t in ordered]),
+    )
+
+
+def lookup_tier(value, tiers, default=0):
+    """
+    Points for value under a compiled tier table.
+    
+    Picks the highest tier whose threshold is <= value; values below
+    every threshold get default. value may be a scalar or an array.
+    """
+    thresholds, points = tiers
+    i = np.searchsorted(thresholds, value, side="right") - 1
+    if np.ndim(i) == 0:
+        return points[i].item() if i >= 0 else default
+    return np.where(i >= 0, points[np.maximum(i, 0)], default)
+
+
+DIVERSITY_TIERS = _compile_tiers(_FLORAL_CFG.get("diversity_tiers", ()), "min_species")
+COVERAGE_TIERS = _compile_tiers(_FLORAL_CFG.get("coverage_tiers", ()), "min_pct")
+GROUND_TIERS = _compile_tiers(_NESTING_CFG.get("ground_tiers", ()), "min_sqft")
+NEIGHBOR_TIERS = _compile_tiers(_CONNECTIVITY_CFG.get("neighbor_tiers", ()), "min_neighbors")
+NATIVE_TIERS = _compile_tiers(_MANAGEMENT_CFG.get("native_tiers", ()), "min_pct")
+
+# /api/scoring/methodology never changes while the process runs.
+# A missing weights/citations entry is reported as None, an empty one as is.
+_weights = _ACTIVE.get("weights")
+_citations = _ACTIVE.get("citations")
+_METHODOLOGY = {
+    "version": ACTIVE_MODEL_VERSION,
+    "name": _ACTIVE.get("name"),
+    "description": _ACTIVE.get("description"),
+    "weights": None if _weights is None else dict(_weights),
+    "citations": None if _citations is None else list(_citations),
+    "impervious_threshold": IMPERVIOUS_THRESHOLD_PCT,
+    "fall_bloom_weight": f"{FALL_POINTS} points (1.5-2x standard)",
+}
+
+
 def get_active_model():
-    """Get the currently active scoring model config."""
-    return SCORING_MODELS.get(ACTIVE_MODEL_VERSION, SCORING_MODELS["2.0.0"])
+    """Get the currently active scoring model config (read-only)."""
+    return _ACTIVE
 
 
 def get_model(version):
@@ -218,13 +288,4 @@ def register_config_routes(app):
     @app.route('/api/scoring/methodology', methods=['GET'])
     def get_methodology():
         """Get current scoring methodology for transparency."""
-        model = get_active_model()
-        return jsonify({
-            "version": get_model_version(),
-            "name": model.get("name"),
-            "description": model.get("description"),
-            "weights": model.get("weights"),
-            "citations": model.get("citations"),
-            "impervious_threshold": model.get("impervious_config", {}).get("threshold_pct"),
-            "fall_bloom_weight": f"{model.get('floral_config', {}).get('fall_points', 6)} points (1.5-2x standard)",
-        })
+        return jsonify(_METHODOLOGY)
@@ -12,9 +12,26 @@ Key insight: September resources get 1.5-2× weight due to
 84.5% nectar deficit during peak pollinator activity.
 """
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field
-from enum import Enum
+from bisect import bisect_right
+from collections import OrderedDict
+import threading
+from typing import Any, List, Mapping, Optional
+from dataclasses import dataclass, field, fields, replace
+from enum import Enum, IntEnum
+from operator import attrgetter
+from types import MappingProxyType
+
+import numpy as np
+import orjson
+
+from scoring_config import (
+    COVERAGE_TIERS,
+    DIVERSITY_TIERS,
+    GROUND_TIERS,
+    NATIVE_TIERS,
+    NEIGHBOR_TIERS,
+    lookup_tier,
+)
 
 
 class Season(Enum):
@@ -23,7 +40,52 @@ class Season(Enum):
     FALL = "fall"          # September-October (CRITICAL)
 
 
-@dataclass
+SPRING_BIT = 1
+SUMMER_BIT = 2
+FALL_BIT = 4
+SEASON_BITS = {Season.SPRING: SPRING_BIT, Season.SUMMER: SUMMER_BIT, Season.FALL: FALL_BIT}
+
+
+class _Frequency(IntEnum):
+    """Integer-coded frequency answer; OTHER is any unrecognized value."""
+    
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+    
+    @classmethod
+    def parse(cls, value):
+        """Member for a stored value: a member, its code, or its label."""
+        if isinstance(value, str):
+            member = cls.__members__.get(value.upper())
+            if member is not None and member.label == value:
+                return member
+            return cls.OTHER
+        try:
+            return cls(value)
+        except ValueError:
+            return cls.OTHER
+
+
+class MowFreq(_Frequency):
+    """Mowing frequency, ordered from most to least disturbance."""
+    OTHER = -1
+    WEEKLY = 0
+    BIWEEKLY = 1
+    MONTHLY = 2
+    RARELY = 3
+
+
+class PestFreq(_Frequency):
+    """Pesticide use frequency."""
+    OTHER = -1
+    NEVER = 0
+    RARELY = 1
+    SOMETIMES = 2
+    OFTEN = 3
+
+
+@dataclass(slots=True)
 class PlantInventory:
     """User-reported plant inventory."""
     species: str
@@ -31,9 +93,41 @@ class PlantInventory:
     bloom_seasons: List[Season] = field(default_factory=list)
     is_native: bool = True
     is_milkweed: bool = False
+    
+    # SEASON_BITS of bloom_seasons, filled by __post_init__
+    _bloom_mask: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        mask = 0
+        for season in self.bloom_seasons:
+            mask |= SEASON_BITS.get(season, 0)
+        self._bloom_mask = mask
+    
+    @classmethod
+    def from_dict(cls, d: dict) -> "PlantInventory":
+        """
+        Build from a plant dict (API payload or DB row); unknown keys are ignored.
+        
+        Season labels ("fall") are converted to Season members; unknown
+        labels are dropped.
+        """
+        get = d.get
+        seasons = []
+        for value in get("bloom_seasons") or ():
+            try:
+                seasons.append(Season(value))
+            except ValueError:
+                continue
+        return cls(
+            get("species", ""),
+            get("count", 1),
+            seasons,
+            get("is_native", True),
+            get("is_milkweed", False),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class PropertyData:
     """All data needed to score a property."""
     # Location
@@ -60,15 +154,68 @@ class PropertyData:
     
     # Management (user-reported)
     uses_pesticides: bool = False
-    pesticide_frequency: str = "never"  # never, rarely, sometimes, often
-    mowing_frequency: str = "weekly"  # weekly, biweekly, monthly, rarely
+    # Labels ("never", "weekly", ...) are parsed to members by __post_init__
+    pesticide_frequency: PestFreq = PestFreq.NEVER  # never, rarely, sometimes, often
+    mowing_frequency: MowFreq = MowFreq.WEEKLY  # weekly, biweekly, monthly, rarely
     
     # Property characteristics (from parcel data or estimate)
     lot_size_sqft: float = 5000
     impervious_surface_pct: float = 30  # buildings, driveway, etc.
+    
+    # Plant aggregates, filled once from `plants` by __post_init__.
+    # Rebuild the PropertyData (or call __post_init__) after editing plants.
+    _total_count: int = field(default=0, init=False, repr=False, compare=False)
+    _native_count: int = field(default=0, init=False, repr=False, compare=False)
+    _milkweed_count: int = field(default=0, init=False, repr=False, compare=False)
+    _has_milkweed: bool = field(default=False, init=False, repr=False, compare=False)
+    _season_mask: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.pesticide_frequency = PestFreq.parse(self.pesticide_frequency)
+        self.mowing_frequency = MowFreq.parse(self.mowing_frequency)
+        
+        native = milkweed = 0
+        has_milkweed = False
+        mask = 0
+        for p in self.plants:
+            if p.is_native:
+                native += 1
+            if p.is_milkweed:
+                has_milkweed = True
+                milkweed += p.count
+            mask |= p._bloom_mask
+        self._total_count = len(self.plants)
+        self._native_count = native
+        self._milkweed_count = milkweed
+        self._has_milkweed = has_milkweed
+        self._season_mask = mask
+    
+    @classmethod
+    def from_dict(cls, d: dict) -> "PropertyData":
+        """
+        Build from a validated dict keyed by field name (e.g. a JSON body).
+        
+        Plants may be dicts or PlantInventory; missing fields take their
+        defaults and unknown keys are ignored.
+        """
+        plants = [
+            p if isinstance(p, PlantInventory) else PlantInventory.from_dict(p)
+            for p in d.get("plants") or ()
+        ]
+        return cls(
+            d["lat"], d["lng"], plants=plants,
+            **{name: d[name] for name in _PROPERTY_FIELDS if name in d},
+        )
 
 
-@dataclass
+# PropertyData fields from_dict copies from the dict as-is
+_PROPERTY_FIELDS = tuple(
+    f.name for f in fields(PropertyData)
+    if f.init and f.name not in ("lat", "lng", "plants")
+)
+
+
+@dataclass(slots=True)
 class ScoreBreakdown:
     """Detailed score breakdown for transparency."""
     
@@ -103,16 +250,58 @@ class ScoreBreakdown:
     # Metadata
     confidence: str = "low"          # low, medium, high
     data_completeness: float = 0     # 0-100%
-    recommendations: List[str] = field(default_factory=list)
+    # Shared read-only payloads; dataclasses.asdict and json.dumps fail on
+    # them, so serialize with to_dict() or to_json_bytes()
+    recommendations: List[Mapping[str, Any]] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        """
+        Plain-dict copy, safe for json.dumps and free to mutate.
+        
+        Use this rather than dataclasses.asdict, which cannot copy the
+        read-only recommendation payloads.
+        """
+        d = {f.name: getattr(self, f.name) for f in fields(self)}
+        d["recommendations"] = [dict(r) for r in self.recommendations]
+        return d
+    
+    def to_json_bytes(self) -> bytes:
+        """This breakdown as UTF-8 JSON, recommendations included."""
+        # default=dict covers the read-only recommendation payloads
+        return orjson.dumps(self, default=dict)
+    
+    @classmethod
+    def from_batch(cls, frame, i: int) -> "ScoreBreakdown":
+        """
+        Row i of a score_properties_batch frame as a ScoreBreakdown.
+        
+        Bulk callers should stay on the frame; this is for the odd row that
+        needs the object form. Recommendations are not part of the batch output.
+        """
+        row = frame.iloc[i]
+        kwargs = {}
+        for name in frame.columns:
+            if name in cls.__dataclass_fields__:
+                value = row[name]
+                kwargs[name] = value.item() if hasattr(value, "item") else value
+        return cls(**kwargs)
 
 
 # =============================================================================
 # SCORING FUNCTIONS
 # =============================================================================
 
-def score_floral_resources(data: PropertyData) -> Dict[str, float]:
+# Ladders with no scoring_config table, in lookup_tier's (thresholds, points) form
+MILKWEED_TIERS = (np.array([1, 3, 5], dtype=np.float64), np.array([3, 4, 5]))
+GREEN_SPACE_TIERS = (np.array([5, 10, 20, 30], dtype=np.float64), np.array([3, 5, 7, 10]))
+GREEN_SPACE_BASELINE = 2  # Below 5% green space (urban)
+
+# Anything else ("often") scores 0
+PESTICIDE_POINTS = {PestFreq.NEVER: 8, PestFreq.RARELY: 5, PestFreq.SOMETIMES: 2}
+
+def score_floral_resources(data: PropertyData, out: ScoreBreakdown) -> None:
     """
-    Score floral resources (35 points max).
+    Score floral resources (35 points max) into out.floral_*.
     
     Research basis:
     - Floral resources correlate with pollinator abundance at R²=0.45-0.75
@@ -120,89 +309,43 @@ def score_floral_resources(data: PropertyData) -> Dict[str, float]:
     - Fall resources get 1.5-2× weight (84.5% deficit finding)
     """
     
-    scores = {
-        "diversity": 0,
-        "coverage": 0,
-        "spring": 0,
-        "summer": 0,
-        "fall": 0,
-        "milkweed_bonus": 0,
-        "total": 0,
-    }
-    
-    plants = data.plants
-    
     # DIVERSITY: 0-12 points
     # Count unique native flowering species
-    native_species = len([p for p in plants if p.is_native])
-    total_species = len(plants)
-    
-    if native_species >= 10:
-        scores["diversity"] = 12
-    elif native_species >= 7:
-        scores["diversity"] = 10
-    elif native_species >= 5:
-        scores["diversity"] = 8
-    elif native_species >= 3:
-        scores["diversity"] = 5
-    elif native_species >= 1:
-        scores["diversity"] = 2
+    native_species = data._native_count
+    total_species = data._total_count
+    
+    diversity = lookup_tier(native_species, DIVERSITY_TIERS)
     
     # Bonus for non-native but beneficial (capped)
     non_native_bonus = min((total_species - native_species) * 0.5, 2)
-    scores["diversity"] = min(scores["diversity"] + non_native_bonus, 12)
+    diversity = min(diversity + non_native_bonus, 12)
     
     # COVERAGE: 0-8 points
-    coverage = data.estimated_flower_coverage_pct
-    if coverage >= 30:
-        scores["coverage"] = 8
-    elif coverage >= 20:
-        scores["coverage"] = 6
-    elif coverage >= 10:
-        scores["coverage"] = 4
-    elif coverage >= 5:
-        scores["coverage"] = 2
+    coverage = lookup_tier(data.estimated_flower_coverage_pct, COVERAGE_TIERS)
     
     # SEASONAL CONTINUITY: Spring 2, Summer 2, Fall 6 (WEIGHTED)
-    seasons_covered = {Season.SPRING: False, Season.SUMMER: False, Season.FALL: False}
-    
-    for plant in plants:
-        for season in plant.bloom_seasons:
-            seasons_covered[season] = True
-    
-    if seasons_covered[Season.SPRING]:
-        scores["spring"] = 2
-    if seasons_covered[Season.SUMMER]:
-        scores["summer"] = 2
-    if seasons_covered[Season.FALL]:
-        scores["fall"] = 6  # 1.5-2× weight for September
+    mask = data._season_mask
+    spring = 2 if mask & SPRING_BIT else 0
+    summer = 2 if mask & SUMMER_BIT else 0
+    fall = 6 if mask & FALL_BIT else 0  # 1.5-2× weight for September
     
     # MILKWEED BONUS: 0-5 points
-    milkweed_count = sum(p.count for p in plants if p.is_milkweed)
-    if milkweed_count >= 5:
-        scores["milkweed_bonus"] = 5
-    elif milkweed_count >= 3:
-        scores["milkweed_bonus"] = 4
-    elif milkweed_count >= 1:
-        scores["milkweed_bonus"] = 3
+    milkweed_bonus = lookup_tier(data._milkweed_count, MILKWEED_TIERS)
     
-    # TOTAL (capped at 35)
-    scores["total"] = min(
-        scores["diversity"] + 
-        scores["coverage"] + 
-        scores["spring"] + 
-        scores["summer"] + 
-        scores["fall"] + 
-        scores["milkweed_bonus"],
-        35
-    )
+    out.floral_diversity = diversity
+    out.floral_coverage = coverage
+    out.floral_spring = spring
+    out.floral_summer = summer
+    out.floral_fall = fall
+    out.floral_milkweed_bonus = milkweed_bonus
     
-    return scores
+    # TOTAL (capped at 35)
+    out.floral_score = min(diversity + coverage + spring + summer + fall + milkweed_bonus, 35)
 
 
-def score_nesting_habitat(data: PropertyData) -> Dict[str, float]:
+def score_nesting_habitat(data: PropertyData, out: ScoreBreakdown) -> None:
     """
-    Score nesting sites (30 points max).
+    Score nesting sites (30 points max) into out.nesting_*.
     
     Research basis:
     - Nesting suitability correlates with species richness at R²=0.35-0.65
@@ -211,24 +354,12 @@ def score_nesting_habitat(data: PropertyData) -> Dict[str, float]:
     - Undisturbed areas critical for overwintering
     """
     
-    scores = {
-        "ground": 0,
-        "cavity": 0,
-        "undisturbed": 0,
-        "total": 0,
-    }
-    
     # GROUND NESTING: 0-10 points
     # 70% of native bees are ground nesters
+    # Any reported bare ground earns the lowest tier, even if unmeasured
+    ground = 0
     if data.has_bare_ground:
-        if data.bare_ground_sqft >= 50:
-            scores["ground"] = 10
-        elif data.bare_ground_sqft >= 25:
-            scores["ground"] = 7
-        elif data.bare_ground_sqft >= 10:
-            scores["ground"] = 5
-        else:
-            scores["ground"] = 3
+        ground = lookup_tier(data.bare_ground_sqft, GROUND_TIERS, default=3)
     
     # CAVITY NESTING: 0-10 points
     cavity_features = 0
@@ -238,121 +369,80 @@ def score_nesting_habitat(data: PropertyData) -> Dict[str, float]:
         cavity_features += 3
     if data.has_brush_pile:
         cavity_features += 3
-    scores["cavity"] = min(cavity_features, 10)
+    cavity = min(cavity_features, 10)
     
     # UNDISTURBED AREAS: 0-10 points
     undisturbed = 0
     if data.leaves_stems_over_winter:
         undisturbed += 5  # Critical for overwintering
-    if data.mowing_frequency in ["monthly", "rarely"]:
+    if data.mowing_frequency >= MowFreq.MONTHLY:
         undisturbed += 3
-    elif data.mowing_frequency == "biweekly":
+    elif data.mowing_frequency == MowFreq.BIWEEKLY:
         undisturbed += 1
     if data.has_brush_pile:
         undisturbed += 2
-    scores["undisturbed"] = min(undisturbed, 10)
-    
-    scores["total"] = scores["ground"] + scores["cavity"] + scores["undisturbed"]
+    undisturbed = min(undisturbed, 10)
     
-    return scores
+    out.nesting_ground = ground
+    out.nesting_cavity = cavity
+    out.nesting_undisturbed = undisturbed
+    out.nesting_score = ground + cavity + undisturbed
 
 
-def score_connectivity(data: PropertyData) -> Dict[str, float]:
+def score_connectivity(data: PropertyData, out: ScoreBreakdown) -> None:
     """
-    Score connectivity (20 points max).
+    Score connectivity (20 points max) into out.connectivity_score.
     
     Pioneer adjustment:
     - Early adopters get bonus for starting the network
     - Weight shifts to neighbor count as network grows
     """
     
-    scores = {
-        "neighbors": 0,
-        "green_space": 0,
-        "pioneer_bonus": 0,
-        "total": 0,
-    }
-    
     neighbors = data.neighbors_in_program
     
     # PIONEER BONUS: Rewards being first
     if neighbors == 0:
-        scores["pioneer_bonus"] = 8  # First in area
-        scores["neighbors"] = 0
+        pioneer_bonus = 8  # First in area
+        neighbor_points = 0
     elif neighbors <= 2:
-        scores["pioneer_bonus"] = 4  # Early adopter
-        scores["neighbors"] = neighbors * 2
+        pioneer_bonus = 4  # Early adopter
+        neighbor_points = neighbors * 2
     else:
-        scores["pioneer_bonus"] = 0  # Established network
-        if neighbors >= 5:
-            scores["neighbors"] = 10
-        elif neighbors >= 3:
-            scores["neighbors"] = 7
-        else:
-            scores["neighbors"] = 5
+        pioneer_bonus = 0  # Established network
+        neighbor_points = lookup_tier(neighbors, NEIGHBOR_TIERS)
     
     # GREEN SPACE WITHIN 500m
-    green_pct = data.green_space_within_500m
-    if green_pct >= 30:
-        scores["green_space"] = 10
-    elif green_pct >= 20:
-        scores["green_space"] = 7
-    elif green_pct >= 10:
-        scores["green_space"] = 5
-    elif green_pct >= 5:
-        scores["green_space"] = 3
-    else:
-        scores["green_space"] = 2  # Baseline for urban
-    
-    scores["total"] = min(
-        scores["neighbors"] + scores["green_space"] + scores["pioneer_bonus"],
-        20
+    green_space = lookup_tier(
+        data.green_space_within_500m, GREEN_SPACE_TIERS, default=GREEN_SPACE_BASELINE
     )
     
-    return scores
+    out.connectivity_score = min(neighbor_points + green_space + pioneer_bonus, 20)
 
 
 
-def score_management(data: PropertyData) -> Dict[str, float]:
+def score_management(data: PropertyData, out: ScoreBreakdown) -> None:
     """
-    Score management quality (15 points max).
+    Score management quality (15 points max) into out.management_score.
     
     Research basis:
     - Pesticides directly harm pollinators
     - Native plant proportion indicates long-term sustainability
     """
     
-    scores = {
-        "pesticide_free": 0,
-        "native_proportion": 0,
-        "total": 0,
-    }
-    
     # PESTICIDE-FREE: 0-8 points
-    if not data.uses_pesticides or data.pesticide_frequency == "never":
-        scores["pesticide_free"] = 8
-    elif data.pesticide_frequency == "rarely":
-        scores["pesticide_free"] = 5
-    elif data.pesticide_frequency == "sometimes":
-        scores["pesticide_free"] = 2
-    # "often" = 0
+    if not data.uses_pesticides:
+        pesticide_free = PESTICIDE_POINTS[PestFreq.NEVER]
+    else:
+        pesticide_free = PESTICIDE_POINTS.get(data.pesticide_frequency, 0)
     
     # NATIVE PROPORTION: 0-7 points
-    total_plants = len(data.plants)
+    native_proportion = 0
+    total_plants = data._total_count
     if total_plants > 0:
-        native_pct = len([p for p in data.plants if p.is_native]) / total_plants * 100
-        if native_pct >= 80:
-            scores["native_proportion"] = 7
-        elif native_pct >= 60:
-            scores["native_proportion"] = 5
-        elif native_pct >= 40:
-            scores["native_proportion"] = 3
-        elif native_pct >= 20:
-            scores["native_proportion"] = 1
-    
-    scores["total"] = scores["pesticide_free"] + scores["native_proportion"]
+        native_pct = data._native_count / total_plants * 100
+        native_proportion = lookup_tier(native_pct, NATIVE_TIERS)
     
-    return scores
+    out.management_score = pesticide_free + native_proportion
 
 
 def calculate_impervious_penalty(data: PropertyData) -> float:
@@ -384,7 +474,7 @@ def calculate_data_completeness(data: PropertyData) -> float:
     fields_provided = 0
     total_fields = 10
     
-    if len(data.plants) > 0:
+    if data._total_count > 0:
         fields_provided += 1
     if data.estimated_flower_coverage_pct > 0:
         fields_provided += 1
@@ -394,9 +484,9 @@ def calculate_data_completeness(data: PropertyData) -> float:
         fields_provided += 1
     if data.leaves_stems_over_winter:
         fields_provided += 1
-    if data.mowing_frequency != "weekly":  # Non-default
+    if data.mowing_frequency != MowFreq.WEEKLY:  # Non-default
         fields_provided += 1
-    if data.pesticide_frequency != "never":  # User considered it
+    if data.pesticide_frequency != PestFreq.NEVER:  # User considered it
         fields_provided += 1
     if data.lot_size_sqft != 5000:  # Non-default
         fields_provided += 1
@@ -408,140 +498,156 @@ def calculate_data_completeness(data: PropertyData) -> float:
     return (fields_provided / total_fields) * 100
 
 
-def generate_recommendations(data: PropertyData, scores: ScoreBreakdown) -> List[str]:
-    """Generate actionable recommendations based on scores."""
-    
-    recs = []
-    
+# Recommendation payloads are read-only and shared by every result that
+# includes them; copy one (dict(rec)) before changing it. Serialize a
+# breakdown with ScoreBreakdown.to_dict() or to_json_bytes().
+_REC_FALL_GAP = MappingProxyType({
+    "priority": "critical",
+    "title": "September Nectar Gap",
+    "message": "Add fall-blooming plants for monarch migration",
+    "plants": ("Rabbitbrush", "Goldenrod", "Asters"),
+    "impact": "+6 points"
+})
+_REC_MILKWEED = MappingProxyType({
+    "priority": "high",
+    "title": "Missing Host Plant",
+    "message": "Monarchs can only lay eggs on milkweed",
+    "plants": ("Showy Milkweed", "Narrowleaf Milkweed"),
+    "impact": "+3-5 points"
+})
+_REC_GROUND = MappingProxyType({
+    "priority": "medium",
+    "title": "Ground Nesting Habitat",
+    "message": "70% of native bees nest in bare ground",
+    "action": "Leave a patch of undisturbed bare soil",
+    "impact": "+5-10 points"
+})
+_REC_OVERWINTER = MappingProxyType({
+    "priority": "medium",
+    "title": "Overwintering Habitat",
+    "message": "Leave stems and leaves through winter",
+    "action": "Delay spring cleanup until temps exceed 50°F",
+    "impact": "+5 points"
+})
+_REC_NEIGHBOR = MappingProxyType({
+    "priority": "medium",
+    "title": "Invite a Neighbor",
+    "message": "Connected habitats are more effective",
+    "action": "Invite a neighbor to join the program",
+    "impact": "+3-10 points"
+})
+_REC_PESTICIDES = MappingProxyType({
+    "priority": "high",
+    "title": "Reduce Pesticides",
+    "message": "Pesticides harm pollinators directly",
+    "action": "Try integrated pest management instead",
+    "impact": "+5-8 points"
+})
+
+# (predicate(data, scores), payload) in output order.
+# Predicates read the plant aggregates, never data.plants.
+_RULES = (
     # CRITICAL: September gap
-    has_fall_blooms = any(
-        Season.FALL in p.bloom_seasons 
-        for p in data.plants
-    )
-    if not has_fall_blooms:
-        recs.append({
-            "priority": "critical",
-            "title": "September Nectar Gap",
-            "message": "Add fall-blooming plants for monarch migration",
-            "plants": ["Rabbitbrush", "Goldenrod", "Asters"],
-            "impact": "+6 points"
-        })
-    
+    (lambda d, s: not d._season_mask & FALL_BIT, _REC_FALL_GAP),
     # CRITICAL: No milkweed
-    has_milkweed = any(p.is_milkweed for p in data.plants)
-    if not has_milkweed:
-        recs.append({
-            "priority": "high",
-            "title": "Missing Host Plant",
-            "message": "Monarchs can only lay eggs on milkweed",
-            "plants": ["Showy Milkweed", "Narrowleaf Milkweed"],
-            "impact": "+3-5 points"
-        })
-    
+    (lambda d, s: not d._has_milkweed, _REC_MILKWEED),
     # Nesting habitat
-    if scores.nesting_score < 15:
-        if not data.has_bare_ground:
-            recs.append({
-                "priority": "medium",
-                "title": "Ground Nesting Habitat",
-                "message": "70% of native bees nest in bare ground",
-                "action": "Leave a patch of undisturbed bare soil",
-                "impact": "+5-10 points"
-            })
-        if not data.leaves_stems_over_winter:
-            recs.append({
-                "priority": "medium",
-                "title": "Overwintering Habitat",
-                "message": "Leave stems and leaves through winter",
-                "action": "Delay spring cleanup until temps exceed 50°F",
-                "impact": "+5 points"
-            })
-    
+    (lambda d, s: s.nesting_score < 15 and not d.has_bare_ground, _REC_GROUND),
+    (lambda d, s: s.nesting_score < 15 and not d.leaves_stems_over_winter, _REC_OVERWINTER),
     # Connectivity
-    if data.neighbors_in_program == 0:
-        recs.append({
-            "priority": "medium",
-            "title": "Invite a Neighbor",
-            "message": "Connected habitats are more effective",
-            "action": "Invite a neighbor to join the program",
-            "impact": "+3-10 points"
-        })
-    
+    (lambda d, s: d.neighbors_in_program == 0, _REC_NEIGHBOR),
     # Pesticides
-    if data.uses_pesticides and data.pesticide_frequency in ["sometimes", "often"]:
-        recs.append({
-            "priority": "high",
-            "title": "Reduce Pesticides",
-            "message": "Pesticides harm pollinators directly",
-            "action": "Try integrated pest management instead",
-            "impact": "+5-8 points"
-        })
+    (lambda d, s: d.uses_pesticides and d.pesticide_frequency >= PestFreq.SOMETIMES, _REC_PESTICIDES),
+)
+
+
+def generate_recommendations(data: PropertyData, scores: ScoreBreakdown) -> List[Mapping[str, Any]]:
+    """
+    Generate actionable recommendations based on scores.
     
-    return recs
+    Entries are the shared, read-only _REC_* payloads, not copies, so
+    json.dumps and dataclasses.asdict reject them; go through
+    ScoreBreakdown.to_dict() or dict(rec) for a plain dict.
+    """
+    return [payload for predicate, payload in _RULES if predicate(data, scores)]
+
+
+# Lower bounds for each grade/confidence above the first; bisect picks the label
+_GRADE_THRESHOLDS = (50, 60, 70, 80, 90)
+_GRADE_LABELS = ("F", "D", "C", "B", "A", "A+")
+_CONFIDENCE_THRESHOLDS = (40, 70)
+_CONFIDENCE_LABELS = ("low", "medium", "high")
 
 
 def get_grade(score: float) -> str:
     """Convert numeric score to letter grade."""
-    if score >= 90:
-        return "A+"
-    elif score >= 80:
-        return "A"
-    elif score >= 70:
-        return "B"
-    elif score >= 60:
-        return "C"
-    elif score >= 50:
-        return "D"
-    else:
-        return "F"
+    return _GRADE_LABELS[bisect_right(_GRADE_THRESHOLDS, score)]
 
 
 def get_confidence(completeness: float) -> str:
     """Determine confidence level based on data completeness."""
-    if completeness >= 70:
-        return "high"
-    elif completeness >= 40:
-        return "medium"
-    else:
-        return "low"
+    return _CONFIDENCE_LABELS[bisect_right(_CONFIDENCE_THRESHOLDS, completeness)]
 
 
 # =============================================================================
 # MAIN SCORING FUNCTION
 # =============================================================================
 
+# Lookups are lock-free and tolerate a concurrent eviction; insert + evict
+# hold the lock (same scheme as core.engine.CacheManager)
+_PROPERTY_CACHE_MAX = 4096
+_property_cache = OrderedDict()
+_property_cache_lock = threading.Lock()
+
+# Every PropertyData input the scorers read. Location, grid_hash and
+# distance_to_nearest_habitat_m don't affect the score, so identical yards
+# at different addresses share a cache entry; plants enter via aggregates.
+_SCORE_KEY = attrgetter(
+    "_total_count", "_native_count", "_milkweed_count", "_has_milkweed",
+    "_season_mask", "estimated_flower_coverage_pct",
+    "has_bare_ground", "bare_ground_sqft", "has_dead_wood", "has_brush_pile",
+    "has_bee_hotel", "leaves_stems_over_winter",
+    "neighbors_in_program", "green_space_within_500m",
+    "uses_pesticides", "pesticide_frequency", "mowing_frequency",
+    "lot_size_sqft", "impervious_surface_pct",
+)
+
+
 def score_property(data: PropertyData) -> ScoreBreakdown:
     """
     Calculate complete property score with breakdown.
     
     Returns ScoreBreakdown with all components and recommendations.
+    Results are memoized on the scoring inputs; each call gets its own copy.
     """
-    
+    try:
+        key = _SCORE_KEY(data)
+        cached = _property_cache.get(key)
+    except TypeError:  # unhashable field value
+        return _score_property(data)
+    if cached is None:
+        cached = _score_property(data)
+        with _property_cache_lock:
+            _property_cache[key] = cached
+            if len(_property_cache) > _PROPERTY_CACHE_MAX:
+                _property_cache.popitem(last=False)
+    else:
+        try:
+            _property_cache.move_to_end(key)
+        except KeyError:
+            pass  # evicted by a concurrent writer; cached is still valid
+    return replace(cached, recommendations=list(cached.recommendations))
+
+
+def _score_property(data: PropertyData) -> ScoreBreakdown:
     breakdown = ScoreBreakdown()
     
     # Calculate each component
-    floral = score_floral_resources(data)
-    nesting = score_nesting_habitat(data)
-    connectivity = score_connectivity(data)
-    management = score_management(data)
+    score_floral_resources(data, breakdown)
+    score_nesting_habitat(data, breakdown)
+    score_connectivity(data, breakdown)
+    score_management(data, breakdown)
     impervious = calculate_impervious_penalty(data)
-    
-    # Populate breakdown
-    breakdown.floral_score = floral["total"]
-    breakdown.floral_diversity = floral["diversity"]
-    breakdown.floral_coverage = floral["coverage"]
-    breakdown.floral_spring = floral["spring"]
-    breakdown.floral_summer = floral["summer"]
-    breakdown.floral_fall = floral["fall"]
-    breakdown.floral_milkweed_bonus = floral["milkweed_bonus"]
-    
-    breakdown.nesting_score = nesting["total"]
-    breakdown.nesting_ground = nesting["ground"]
-    breakdown.nesting_cavity = nesting["cavity"]
-    breakdown.nesting_undisturbed = nesting["undisturbed"]
-    
-    breakdown.connectivity_score = connectivity["total"]
-    breakdown.management_score = management["total"]
     breakdown.impervious_penalty = impervious
     
     # Calculate totals
@@ -563,6 +669,405 @@ def score_property(data: PropertyData) -> ScoreBreakdown:
     return breakdown
 
 
+# =============================================================================
+# BATCH SCORING
+# =============================================================================
+
+# PropertyData scalar fields the batch scorer reads, with their defaults
+BATCH_DEFAULTS = {
+    "estimated_flower_coverage_pct": 0,
+    "has_bare_ground": False,
+    "bare_ground_sqft": 0,
+    "has_dead_wood": False,
+    "has_brush_pile": False,
+    "has_bee_hotel": False,
+    "leaves_stems_over_winter": False,
+    "neighbors_in_program": 0,
+    "green_space_within_500m": 0,
+    "uses_pesticides": False,
+    "pesticide_frequency": int(PestFreq.NEVER),
+    "mowing_frequency": int(MowFreq.WEEKLY),
+    "lot_size_sqft": 5000,
+    "impervious_surface_pct": 30,
+    # Plant aggregates
+    "native_species": 0,
+    "total_species": 0,
+    "milkweed_count": 0,
+    "has_milkweed": False,
+    "has_spring": False,
+    "has_summer": False,
+    "has_fall": False,
+}
+
+
+def properties_frame(properties: List[PropertyData]):
+    """One row per property in the columnar layout score_properties_batch expects."""
+    import pandas as pd
+    
+    rows = []
+    for data in properties:
+        row = {name: getattr(data, name) for name in BATCH_DEFAULTS if hasattr(data, name)}
+        row["pesticide_frequency"] = int(data.pesticide_frequency)
+        row["mowing_frequency"] = int(data.mowing_frequency)
+        row["native_species"] = data._native_count
+        row["total_species"] = data._total_count
+        row["milkweed_count"] = data._milkweed_count
+        row["has_milkweed"] = data._has_milkweed
+        row["has_spring"] = bool(data._season_mask & SPRING_BIT)
+        row["has_summer"] = bool(data._season_mask & SUMMER_BIT)
+        row["has_fall"] = bool(data._season_mask & FALL_BIT)
+        rows.append(row)
+    return pd.DataFrame(rows, columns=list(BATCH_DEFAULTS))
+
+
+def _batch_column(df, name):
+    """df[name] as an array, or the BATCH_DEFAULTS value repeated if absent."""
+    if name in df:
+        return df[name].to_numpy()
+    return np.full(len(df), BATCH_DEFAULTS[name])
+
+
+def _frequency_codes(df, name, freq):
+    """Integer codes for a frequency column holding codes, members or labels."""
+    values = _batch_column(df, name)
+    if values.dtype.kind in "iu":
+        return values
+    import pandas as pd
+    
+    # Parse each distinct label once
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return np.array([freq.parse(v) for v in uniques], dtype=np.int64)[codes]
+
+
+def _mow_points(mowing):
+    return np.select([mowing >= MowFreq.MONTHLY, mowing == MowFreq.BIWEEKLY], [3, 1], default=0)
+
+
+def _pesticide_points(uses_pesticides, pesticide):
+    return np.select(
+        [~uses_pesticides] + [pesticide == level for level in PESTICIDE_POINTS],
+        [PESTICIDE_POINTS[PestFreq.NEVER], *PESTICIDE_POINTS.values()],
+        default=0,
+    )
+
+
+def score_properties_batch(df):
+    """
+    Score many properties at once with column-wise NumPy operations.
+    
+    df holds one row per property with the BATCH_DEFAULTS columns (missing
+    columns take the default). Returns a DataFrame of the same length with
+    the numeric ScoreBreakdown fields plus grade and confidence; values
+    match score_property row for row. Recommendations are not produced.
+    """
+    import pandas as pd
+    
+    def col(name):
+        return _batch_column(df, name)
+    
+    native = col("native_species")
+    total_species = col("total_species")
+    coverage = col("estimated_flower_coverage_pct")
+    milkweed = col("milkweed_count")
+    has_bare_ground = col("has_bare_ground").astype(bool)
+    bare_sqft = col("bare_ground_sqft")
+    has_dead_wood = col("has_dead_wood").astype(bool)
+    has_bee_hotel = col("has_bee_hotel").astype(bool)
+    has_brush_pile = col("has_brush_pile").astype(bool)
+    leaves = col("leaves_stems_over_winter").astype(bool)
+    mowing = _frequency_codes(df, "mowing_frequency", MowFreq)
+    neighbors = col("neighbors_in_program")
+    green_pct = col("green_space_within_500m")
+    uses_pesticides = col("uses_pesticides").astype(bool)
+    pesticide = _frequency_codes(df, "pesticide_frequency", PestFreq)
+    impervious = col("impervious_surface_pct").astype(np.float64)
+    
+    # Floral
+    diversity = lookup_tier(native, DIVERSITY_TIERS)
+    non_native_bonus = np.minimum((total_species - native) * 0.5, 2)
+    diversity = np.minimum(diversity + non_native_bonus, 12)
+    floral_coverage = lookup_tier(coverage, COVERAGE_TIERS)
+    spring = np.where(col("has_spring").astype(bool), 2, 0)
+    summer = np.where(col("has_summer").astype(bool), 2, 0)
+    fall = np.where(col("has_fall").astype(bool), 6, 0)
+    milkweed_bonus = lookup_tier(milkweed, MILKWEED_TIERS)
+    floral = np.minimum(diversity + floral_coverage + spring + summer + fall + milkweed_bonus, 35)
+    
+    # Nesting
+    ground = np.where(has_bare_ground, lookup_tier(bare_sqft, GROUND_TIERS, default=3), 0)
+    cavity = np.minimum(4 * has_dead_wood + 3 * has_bee_hotel + 3 * has_brush_pile, 10)
+    undisturbed = np.minimum(5 * leaves + _mow_points(mowing) + 2 * has_brush_pile, 10)
+    nesting = ground + cavity + undisturbed
+    
+    # Connectivity
+    pioneer = np.select([neighbors == 0, neighbors <= 2], [8, 4], default=0)
+    neighbor_points = np.select(
+        [neighbors == 0, neighbors <= 2],
+        [0, neighbors * 2],
+        default=lookup_tier(neighbors, NEIGHBOR_TIERS),
+    )
+    green = lookup_tier(green_pct, GREEN_SPACE_TIERS, default=GREEN_SPACE_BASELINE)
+    connectivity = np.minimum(neighbor_points + green + pioneer, 20)
+    
+    # Management
+    pesticide_free = _pesticide_points(uses_pesticides, pesticide)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        native_pct = native / total_species * 100
+    native_proportion = np.where(total_species > 0, lookup_tier(native_pct, NATIVE_TIERS), 0)
+    management = pesticide_free + native_proportion
+    
+    # Impervious penalty
+    penalty = np.where(impervious > 22, -np.minimum((impervious - 22) * 0.35, 10), 0)
+    
+    raw = floral + nesting + connectivity + management
+    final = np.maximum(0, np.minimum(100, raw + penalty))
+    
+    # Completeness
+    # Accumulate in place into int8 - no int64 temporary per flag
+    provided = (total_species > 0).astype(np.int8)
+    for flag in (
+        coverage > 0,
+        has_bare_ground | (bare_sqft > 0),
+        has_dead_wood | has_bee_hotel | has_brush_pile,
+        leaves,
+        mowing != MowFreq.WEEKLY,
+        pesticide != PestFreq.NEVER,
+        col("lot_size_sqft") != 5000,
+        impervious != 30,
+        neighbors > 0,
+    ):
+        provided += flag
+    completeness = provided / 10 * 100
+    
+    grade = np.array(_GRADE_LABELS)[np.searchsorted(_GRADE_THRESHOLDS, final, side="right")]
+    confidence = np.array(_CONFIDENCE_LABELS)[
+        np.searchsorted(_CONFIDENCE_THRESHOLDS, completeness, side="right")
+    ]
+    
+    return pd.DataFrame({
+        "floral_score": floral,
+        "nesting_score": nesting,
+        "connectivity_score": connectivity,
+        "management_score": management,
+        "floral_diversity": diversity,
+        "floral_coverage": floral_coverage,
+        "floral_spring": spring,
+        "floral_summer": summer,
+        "floral_fall": fall,
+        "floral_milkweed_bonus": milkweed_bonus,
+        "nesting_ground": ground,
+        "nesting_cavity": cavity,
+        "nesting_undisturbed": undisturbed,
+        "impervious_penalty": penalty,
+        "raw_score": raw,
+        "final_score": final,
+        "grade": grade,
+        "confidence": confidence,
+        "data_completeness": completeness,
+    }, index=df.index)
+
+
+def recommendations_batch(df, scores) -> List[List[Mapping[str, Any]]]:
+    """
+    Recommendations for every row of a properties_frame.
+    
+    scores is the matching score_properties_batch frame. Each rule in
+    _RULES becomes one boolean column; the payloads for a row are gathered
+    from that row's true columns. Frames without a has_milkweed column
+    fall back to milkweed_count > 0.
+    """
+    col = lambda name: _batch_column(df, name)
+    if "has_milkweed" in df:
+        has_milkweed = df["has_milkweed"].to_numpy().astype(bool)
+    else:
+        has_milkweed = col("milkweed_count") > 0
+    low_nesting = scores["nesting_score"].to_numpy() < 15
+    masks = np.column_stack([
+        ~col("has_fall").astype(bool),
+        ~has_milkweed,
+        low_nesting & ~col("has_bare_ground").astype(bool),
+        low_nesting & ~col("leaves_stems_over_winter").astype(bool),
+        col("neighbors_in_program") == 0,
+        col("uses_pesticides").astype(bool)
+        & (_frequency_codes(df, "pesticide_frequency", PestFreq) >= PestFreq.SOMETIMES),
+    ])
+    payloads = [payload for _, payload in _RULES]
+    rows, rules = np.nonzero(masks)
+    recs = [[] for _ in range(len(df))]
+    for i, j in zip(rows.tolist(), rules.tolist()):
+        recs[i].append(payloads[j])
+    return recs
+
+
+# numba.prange once _numba_kernel() has compiled the kernel
+prange = range
+
+
+def _tier_points(value, thresholds, points, default):
+    # Tier tables have a handful of rows; scan down from the top
+    for j in range(thresholds.shape[0] - 1, -1, -1):
+        if value >= thresholds[j]:
+            return points[j]
+    return default
+
+
+def _score_kernel(native, total_species, coverage, season_mask, milkweed,
+                  has_bare_ground, bare_sqft, has_dead_wood, has_bee_hotel,
+                  has_brush_pile, leaves, mow_points, neighbors, green_pct,
+                  pesticide_free, impervious, tiers):
+    """
+    Fused per-row scorer for score_totals_batch.
+    
+    Same arithmetic as score_property, one pass with no temporaries.
+    Returns an (n, 6) array: floral, nesting, connectivity, management,
+    impervious penalty, final score.
+    """
+    (div_t, div_p, cov_t, cov_p, ground_t, ground_p, nb_t, nb_p,
+     nat_t, nat_p, mw_t, mw_p, gs_t, gs_p) = tiers
+    n = native.shape[0]
+    out = np.empty((n, 6))
+    for i in prange(n):
+        # Floral
+        diversity = _tier_points(native[i], div_t, div_p, 0)
+        diversity = min(diversity + min((total_species[i] - native[i]) * 0.5, 2.0), 12.0)
+        floral = diversity + _tier_points(coverage[i], cov_t, cov_p, 0)
+        mask = season_mask[i]
+        floral += 2.0 if mask & SPRING_BIT else 0.0
+        floral += 2.0 if mask & SUMMER_BIT else 0.0
+        floral += 6.0 if mask & FALL_BIT else 0.0
+        floral = min(floral + _tier_points(milkweed[i], mw_t, mw_p, 0), 35.0)
+        
+        # Nesting
+        ground = _tier_points(bare_sqft[i], ground_t, ground_p, 3) if has_bare_ground[i] else 0
+        cavity = min(4 * has_dead_wood[i] + 3 * has_bee_hotel[i] + 3 * has_brush_pile[i], 10)
+        undisturbed = min(5 * leaves[i] + mow_points[i] + 2 * has_brush_pile[i], 10)
+        nesting = ground + cavity + undisturbed
+        
+        # Connectivity
+        nb = neighbors[i]
+        if nb == 0:
+            conn = 8
+        elif nb <= 2:
+            conn = nb * 2 + 4
+        else:
+            conn = _tier_points(nb, nb_t, nb_p, 0)
+        green = _tier_points(green_pct[i], gs_t, gs_p, GREEN_SPACE_BASELINE)
+        conn = min(conn + green, 20)
+        
+        # Management
+        mgmt = pesticide_free[i]
+        if total_species[i] > 0:
+            mgmt += _tier_points(native[i] / total_species[i] * 100, nat_t, nat_p, 0)
+        
+        # Impervious penalty
+        penalty = 0.0
+        if impervious[i] > 22:
+            penalty = -min((impervious[i] - 22) * 0.35, 10.0)
+        
+        raw = floral + nesting + conn + mgmt
+        out[i, 0] = floral
+        out[i, 1] = nesting
+        out[i, 2] = conn
+        out[i, 3] = mgmt
+        out[i, 4] = penalty
+        out[i, 5] = max(0.0, min(100.0, raw + penalty))
+    return out
+
+
+_numba_score_kernel = None  # None: not built yet; False: numba missing
+_numba_lock = threading.Lock()
+
+
+def _numba_kernel():
+    """
+    _score_kernel compiled with numba, or None when numba is not installed.
+    
+    Importing numba costs more than the rest of this module, so it happens
+    on the first score_totals_batch call instead of at import.
+    """
+    global _numba_score_kernel, _tier_points, prange
+    if _numba_score_kernel is None:
+        with _numba_lock:
+            if _numba_score_kernel is None:
+                try:
+                    import numba
+                except ImportError:  # optional: score_totals_batch falls back to NumPy
+                    _numba_score_kernel = False
+                    return None
+                # The kernel resolves these globals when numba compiles it
+                prange = numba.prange
+                _tier_points = numba.njit(cache=True)(_tier_points)
+                _numba_score_kernel = numba.njit(parallel=True, cache=True)(_score_kernel)
+    return _numba_score_kernel or None
+
+
+_TOTAL_COLUMNS = (
+    "floral_score",
+    "nesting_score",
+    "connectivity_score",
+    "management_score",
+    "impervious_penalty",
+    "final_score",
+)
+
+
+def score_totals_batch(df):
+    """
+    Component totals and final score for many properties.
+    
+    Takes the same frame as score_properties_batch and returns floral_score,
+    nesting_score, connectivity_score, management_score, impervious_penalty
+    and final_score. With numba installed this runs the fused, parallel
+    _score_kernel, compiled on the first call; otherwise it falls back to
+    score_properties_batch.
+    """
+    kernel = _numba_kernel()
+    if kernel is None:
+        return score_properties_batch(df)[list(_TOTAL_COLUMNS)]
+    
+    import pandas as pd
+    
+    def col(name, dtype):
+        return np.ascontiguousarray(_batch_column(df, name), dtype=dtype)
+    
+    seasons = (
+        col("has_spring", bool) * SPRING_BIT
+        | col("has_summer", bool) * SUMMER_BIT
+        | col("has_fall", bool) * FALL_BIT
+    ).astype(np.int64)
+    # Frequencies are resolved to points here so the kernel only sees numbers
+    mow_points = _mow_points(_frequency_codes(df, "mowing_frequency", MowFreq))
+    pesticide_free = _pesticide_points(
+        col("uses_pesticides", bool), _frequency_codes(df, "pesticide_frequency", PestFreq)
+    )
+    tiers = tuple(
+        np.ascontiguousarray(a, dtype=np.float64)
+        for table in (DIVERSITY_TIERS, COVERAGE_TIERS, GROUND_TIERS, NEIGHBOR_TIERS,
+                      NATIVE_TIERS, MILKWEED_TIERS, GREEN_SPACE_TIERS)
+        for a in table
+    )
+    out = kernel(
+        col("native_species", np.float64),
+        col("total_species", np.float64),
+        col("estimated_flower_coverage_pct", np.float64),
+        seasons,
+        col("milkweed_count", np.float64),
+        col("has_bare_ground", bool),
+        col("bare_ground_sqft", np.float64),
+        col("has_dead_wood", np.int64),
+        col("has_bee_hotel", np.int64),
+        col("has_brush_pile", np.int64),
+        col("leaves_stems_over_winter", np.int64),
+        mow_points.astype(np.int64),
+        col("neighbors_in_program", np.float64),
+        col("green_space_within_500m", np.float64),
+        pesticide_free.astype(np.float64),
+        col("impervious_surface_pct", np.float64),
+        tiers,
+    )
+    return pd.DataFrame(out, columns=list(_TOTAL_COLUMNS), index=df.index)
+
+
 # =============================================================================
 # TEST
 # =============================================================================
@@ -0,0 +1,96 @@
+-- Utah Pollinator Path - Leaderboard RPCs
+-- =======================================
+-- Server-side ranking/aggregation for database.py.
+-- Apply in the Supabase SQL editor. The client falls back to plain
+-- REST queries if a function is not deployed.
+
+-- Window partitions below are index scans, not sorts
+create index if not exists leaderboard_entries_state_score_idx
+    on leaderboard_entries (state, score desc);
+create index if not exists leaderboard_entries_city_score_idx
+    on leaderboard_entries (city, score desc);
+create index if not exists leaderboard_entries_zip_score_idx
+    on leaderboard_entries (zip_code, score desc);
+create index if not exists leaderboard_entries_ward_score_idx
+    on leaderboard_entries (ward, score desc);
+
+
+-- All rankings for one grid_hash in a single round-trip.
+-- Returns {"user": {...}, "rankings": {"state": {...}, "city": ..., ...}}
+-- or null when the grid_hash has no entry. Scopes the user has no
+-- value for come back as null.
+create or replace function user_rankings(ghash text)
+returns jsonb
+language sql
+stable
+as $$
+    with me as (
+        select * from leaderboard_entries where grid_hash = ghash limit 1
+    ),
+    ranked as (
+        select
+            e.grid_hash,
+            rank() over (partition by e.state order by e.score desc) as state_rank,
+            count(*) over (partition by e.state) as state_total,
+            rank() over (partition by e.city order by e.score desc) as city_rank,
+            count(*) over (partition by e.city) as city_total,
+            rank() over (partition by e.zip_code order by e.score desc) as zip_rank,
+            count(*) over (partition by e.zip_code) as zip_total,
+            rank() over (partition by e.ward order by e.score desc) as ward_rank,
+            count(*) over (partition by e.ward) as ward_total
+        from leaderboard_entries e, me
+        where e.state = me.state
+           or e.city = me.city
+           or e.zip_code = me.zip_code
+           or e.ward = me.ward
+    )
+    select jsonb_build_object(
+        'user', to_jsonb(me),
+        'rankings', jsonb_build_object(
+            'state', case when me.state = 'Utah' then jsonb_build_object(
+                'rank', r.state_rank, 'total', r.state_total, 'label', 'Utah')
+                else jsonb_build_object(
+                'rank', null,
+                'total', (select count(*) from leaderboard_entries where state = 'Utah'),
+                'label', 'Utah') end,
+            'city', case when nullif(me.city, '') is not null then jsonb_build_object(
+                'rank', r.city_rank, 'total', r.city_total, 'label', me.city) end,
+            'zip', case when nullif(me.zip_code, '') is not null then jsonb_build_object(
+                'rank', r.zip_rank, 'total', r.zip_total, 'label', me.zip_code) end,
+            'ward', case when nullif(me.ward, '') is not null then jsonb_build_object(
+                'rank', r.ward_rank, 'total', r.ward_total, 'label', me.ward) end
+        )
+    )
+    from me
+    -- left join: an entry with no state/city/zip/ward matches no scope row
+    -- but must still come back (with null ranks)
+    left join ranked r on r.grid_hash = me.grid_hash;
+$$;
+
+
+-- Aggregate stats for one leaderboard scope, computed over every entry in
+-- the scope rather than just the displayed page. lvl/fval mirror the
+-- level/filter_value arguments of database.get_leaderboard.
+create or replace function leaderboard_stats(lvl text, fval text default null)
+returns jsonb
+language sql
+stable
+as $$
+    select jsonb_build_object(
+        'total', count(*),
+        'avg_score', coalesce(round(avg(score)::numeric, 1), 0),
+        'top_score', coalesce(max(score), 0),
+        'pioneers', count(*) filter (where identity_level = 'pioneer'),
+        'champions', count(*) filter (where identity_level = 'migration_champion')
+    )
+    from leaderboard_entries
+    where case
+        when lvl = 'state' then state = 'Utah'
+        when fval is null then true
+        when lvl = 'county' then county = fval
+        when lvl = 'city' then city = fval
+        when lvl = 'zip' then zip_code = fval
+        when lvl = 'ward' then ward = fval
+        else true
+    end;
+$$;
@@ -0,0 +1,55 @@
+-- Utah Pollinator Path - user_scores constraints
+-- ==============================================
+-- score_engine.recalculate_and_store_score upserts with
+-- on_conflict=user_id,grid_hash, which needs this unique key.
+-- The engine writes '' for "no grid"; older rows may hold NULL.
+
+update user_scores set grid_hash = '' where grid_hash is null;
+
+alter table user_scores
+    alter column grid_hash set default '';
+
+-- Keep only the most recent row per (user_id, grid_hash)
+delete from user_scores s
+using (
+    select ctid, row_number() over (
+        partition by user_id, grid_hash
+        order by calculated_at desc nulls last
+    ) as n
+    from user_scores
+) d
+where s.ctid = d.ctid and d.n > 1;
+
+do $$
+begin
+    if not exists (
+        select 1 from pg_constraint where conname = 'user_scores_user_grid_key'
+    ) then
+        alter table user_scores
+            add constraint user_scores_user_grid_key
+            unique nulls not distinct (user_id, grid_hash);
+    end if;
+end $$;
+
+-- Digest of the inputs the stored score was computed from; lets the
+-- engine recognise a recalculation that would not change anything.
+alter table user_scores
+    add column if not exists input_hash text;
+
+-- Leaderboard rank computed in the database (score_engine.get_leaderboard).
+-- user_scores_ranked ranks everyone; user_scores_grid_ranked ranks
+-- within each grid_hash. security_invoker keeps user_scores RLS in force.
+create index if not exists user_scores_total_score_idx
+    on user_scores (total_score desc);
+create index if not exists user_scores_grid_score_idx
+    on user_scores (grid_hash, total_score desc);
+
+create or replace view user_scores_ranked
+with (security_invoker = true) as
+    select s.*, row_number() over (order by s.total_score desc) as rank
+    from user_scores s;
+
+create or replace view user_scores_grid_ranked
+with (security_invoker = true) as
+    select s.*, row_number() over (partition by s.grid_hash order by s.total_score desc) as rank
+    from user_scores s;
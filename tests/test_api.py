@@ -3,13 +3,18 @@ API Test Harness
 =================
 Validates all endpoints work correctly.
 Run: python tests/test_api.py
+
+Endpoint groups run concurrently over one HTTP/2 connection; each group
+prints its results together once its requests are back.
 """
 
-import requests
-import json
+import asyncio
 import time
 import sys
 
+import httpx
+import orjson
+
 # Config
 BASE_URL = "https://utah-pollinator-path.onrender.com"
 ADMIN_KEY = "8a56becc816d0f70f64bde106f5a8c13"
@@ -34,21 +39,18 @@ def skip(name, reason=""):
     print(f"  ⏭️  {name} (skipped: {reason})")
 
 
-def get(endpoint, headers=None, params=None):
+async def get(client, endpoint, headers=None, params=None):
     try:
-        r = requests.get(f"{BASE_URL}{endpoint}", headers=headers, params=params, timeout=30)
-        return r.status_code, r.json() if r.headers.get('content-type', '').startswith('application/json') else r.text
+        r = await client.get(endpoint, headers=headers, params=params)
+        return r.status_code, orjson.loads(r.content) if r.headers.get('content-type', '').startswith('application/json') else r.text
     except Exception as e:
         return 0, str(e)
 
 
-def post(endpoint, data=None, headers=None):
+async def post(client, endpoint, data=None, headers=None):
     try:
-        h = {"Content-Type": "application/json"}
-        if headers:
-            h.update(headers)
-        r = requests.post(f"{BASE_URL}{endpoint}", json=data, headers=h, timeout=30)
-        return r.status_code, r.json() if r.headers.get('content-type', '').startswith('application/json') else r.text
+        r = await client.post(endpoint, json=data, headers=headers)
+        return r.status_code, orjson.loads(r.content) if r.headers.get('content-type', '').startswith('application/json') else r.text
     except Exception as e:
         return 0, str(e)
 
@@ -57,146 +59,172 @@ def admin_headers():
     return {"X-Admin-Key": ADMIN_KEY}
 
 
-def test_health():
+async def test_health(client):
+    status, data = await get(client, "/health")
     print("\n📋 Health Check")
-    status, data = get("/health")
     test("GET /health returns 200", status == 200)
 
 
-def test_public_endpoints():
+async def test_public_endpoints(client):
+    plants, methodology, badges, challenges, observations, stats = await asyncio.gather(
+        get(client, "/api/species/plants"),
+        get(client, "/api/scoring/methodology"),
+        get(client, "/api/badges"),
+        get(client, "/api/challenges"),
+        get(client, "/api/observations"),
+        get(client, "/api/stats"),
+    )
     print("\n📋 Public Endpoints")
-    status, data = get("/api/species/plants")
-    test("GET /api/species/plants", status == 200)
-    status, data = get("/api/scoring/methodology")
-    test("GET /api/scoring/methodology", status == 200)
-    status, data = get("/api/badges")
-    test("GET /api/badges", status == 200)
-    status, data = get("/api/challenges")
-    test("GET /api/challenges", status == 200)
-    status, data = get("/api/observations")
-    test("GET /api/observations", status == 200)
-    status, data = get("/api/stats")
-    test("GET /api/stats", status == 200)
-
-
-def test_scoring_endpoints():
-    print("\n📋 Scoring Endpoints")
+    test("GET /api/species/plants", plants[0] == 200)
+    test("GET /api/scoring/methodology", methodology[0] == 200)
+    test("GET /api/badges", badges[0] == 200)
+    test("GET /api/challenges", challenges[0] == 200)
+    test("GET /api/observations", observations[0] == 200)
+    test("GET /api/stats", stats[0] == 200)
+
+
+async def test_scoring_endpoints(client):
     payload = {
         "lat": 40.6655, "lng": -111.8965,
         "plants": [{"species": "Showy Milkweed", "count": 3, "is_native": True, "is_milkweed": True}],
         "flower_coverage_pct": 20, "has_bare_ground": True, "bare_ground_sqft": 25
     }
-    status, data = post("/api/v2/score", payload)
+    status, data = await post(client, "/api/v2/score", payload)
+    print("\n📋 Scoring Endpoints")
     test("POST /api/v2/score", status == 200)
     test("Score has score field", isinstance(data, dict) and "score" in data)
 
 
-def test_admin_endpoints():
+async def test_admin_endpoints(client):
+    no_key, verify, export = await asyncio.gather(
+        get(client, "/api/admin/export"),
+        get(client, "/api/admin/verify", headers=admin_headers()),
+        get(client, "/api/admin/export", headers=admin_headers()),
+    )
     print("\n📋 Admin Endpoints")
-    status, data = get("/api/admin/export")
-    test("Admin export without key fails", status == 403)
-    status, data = get("/api/admin/verify", headers=admin_headers())
-    test("Admin verify with key succeeds", status == 200)
-    status, data = get("/api/admin/export", headers=admin_headers())
-    test("GET /api/admin/export", status == 200)
+    test("Admin export without key fails", no_key[0] == 403)
+    test("Admin verify with key succeeds", verify[0] == 200)
+    test("GET /api/admin/export", export[0] == 200)
 
 
-def test_jobs_endpoints():
+async def test_jobs_endpoints(client):
+    jobs, history = await asyncio.gather(
+        get(client, "/api/jobs/list"),
+        get(client, "/api/jobs/history"),
+    )
     print("\n📋 Jobs Endpoints")
-    status, data = get("/api/jobs/list")
-    test("GET /api/jobs/list", status == 200)
-    status, data = get("/api/jobs/history")
-    test("GET /api/jobs/history", status == 200)
+    test("GET /api/jobs/list", jobs[0] == 200)
+    test("GET /api/jobs/history", history[0] == 200)
 
 
-def test_stats_endpoints():
+async def test_stats_endpoints(client):
+    growth, dashboard = await asyncio.gather(
+        get(client, "/api/stats/growth?days=7"),
+        get(client, "/api/stats/dashboard"),
+    )
     print("\n📋 Stats Endpoints")
-    status, data = get("/api/stats/growth?days=7")
-    test("GET /api/stats/growth", status == 200)
-    status, data = get("/api/stats/dashboard")
-    test("GET /api/stats/dashboard", status == 200)
+    test("GET /api/stats/growth", growth[0] == 200)
+    test("GET /api/stats/dashboard", dashboard[0] == 200)
 
 
-def test_events_endpoints():
+async def test_events_endpoints(client):
+    types, daily = await asyncio.gather(
+        get(client, "/api/events/types"),
+        get(client, "/api/events/daily?days=7"),
+    )
     print("\n📋 Events Endpoints")
-    status, data = get("/api/events/types")
-    test("GET /api/events/types", status == 200)
-    status, data = get("/api/events/daily?days=7")
-    test("GET /api/events/daily", status == 200)
-
-
-def test_government_endpoints():
+    test("GET /api/events/types", types[0] == 200)
+    test("GET /api/events/daily", daily[0] == 200)
+
+
+async def test_government_endpoints(client):
+    overview, wards, priority, geojson, council = await asyncio.gather(
+        get(client, "/api/gov/overview"),
+        get(client, "/api/gov/wards"),
+        get(client, "/api/gov/priority-areas"),
+        get(client, "/api/gov/geojson/participation"),
+        get(client, "/api/gov/report/council", headers=admin_headers()),
+    )
     print("\n📋 Government Endpoints")
-    status, data = get("/api/gov/overview")
+    status, data = overview
     test("GET /api/gov/overview", status == 200)
     test("Overview has participants", isinstance(data, dict) and "participants" in data)
-    status, data = get("/api/gov/wards")
-    test("GET /api/gov/wards", status == 200)
-    status, data = get("/api/gov/priority-areas")
-    test("GET /api/gov/priority-areas", status == 200)
-    status, data = get("/api/gov/geojson/participation")
-    test("GET /api/gov/geojson/participation", status == 200)
-    status, data = get("/api/gov/report/council", headers=admin_headers())
-    test("GET /api/gov/report/council", status == 200)
-
-
-def test_external_data_endpoints():
+    test("GET /api/gov/wards", wards[0] == 200)
+    test("GET /api/gov/priority-areas", priority[0] == 200)
+    test("GET /api/gov/geojson/participation", geojson[0] == 200)
+    test("GET /api/gov/report/council", council[0] == 200)
+
+
+async def test_external_data_endpoints(client):
+    sources, species, enrich = await asyncio.gather(
+        get(client, "/api/external/sources"),
+        get(client, "/api/external/species?lat=40.666&lng=-111.897"),
+        get(client, "/api/external/enrich?lat=40.666&lng=-111.897"),
+    )
     print("\n📋 External Data Endpoints")
-    status, data = get("/api/external/sources")
-    test("GET /api/external/sources", status == 200)
-    status, data = get("/api/external/species?lat=40.666&lng=-111.897")
-    test("GET /api/external/species", status == 200)
-    status, data = get("/api/external/enrich?lat=40.666&lng=-111.897")
-    test("GET /api/external/enrich", status == 200)
+    test("GET /api/external/sources", sources[0] == 200)
+    test("GET /api/external/species", species[0] == 200)
+    test("GET /api/external/enrich", enrich[0] == 200)
 
 
-def test_unified_map_endpoints():
+async def test_unified_map_endpoints(client):
+    layers, unified, bloom = await asyncio.gather(
+        get(client, "/api/map/layers"),
+        get(client, "/api/map/unified"),
+        get(client, "/api/map/bloom-calendar"),
+    )
     print("\n📋 Unified Map Endpoints")
-    status, data = get("/api/map/layers")
-    test("GET /api/map/layers", status == 200)
-    status, data = get("/api/map/unified")
+    test("GET /api/map/layers", layers[0] == 200)
+    status, data = unified
     test("GET /api/map/unified", status == 200)
     test("Unified has features", isinstance(data, dict) and "features" in data)
-    status, data = get("/api/map/bloom-calendar")
-    test("GET /api/map/bloom-calendar", status == 200)
-
-
-def test_enhanced_map_endpoints():
+    test("GET /api/map/bloom-calendar", bloom[0] == 200)
+
+
+async def test_enhanced_map_endpoints(client):
+    monarch, frost, waystations, bee_cities, corridors, parks, elevation, enhanced = await asyncio.gather(
+        get(client, "/api/map/monarch-status"),
+        get(client, "/api/map/frost-dates?lat=40.666&lng=-111.897"),
+        get(client, "/api/map/waystations"),
+        get(client, "/api/map/bee-cities"),
+        get(client, "/api/map/corridors"),
+        get(client, "/api/map/parks"),
+        get(client, "/api/map/elevation?lat=40.666&lng=-111.897"),
+        get(client, "/api/map/enhanced?lat=40.666&lng=-111.897"),
+    )
     print("\n📋 Enhanced Map Endpoints")
-    status, data = get("/api/map/monarch-status")
-    test("GET /api/map/monarch-status", status == 200)
-    status, data = get("/api/map/frost-dates?lat=40.666&lng=-111.897")
-    test("GET /api/map/frost-dates", status == 200)
-    status, data = get("/api/map/waystations")
-    test("GET /api/map/waystations", status == 200)
-    status, data = get("/api/map/bee-cities")
-    test("GET /api/map/bee-cities", status == 200)
-    status, data = get("/api/map/corridors")
-    test("GET /api/map/corridors", status == 200)
-    status, data = get("/api/map/parks")
-    test("GET /api/map/parks", status == 200)
-    status, data = get("/api/map/elevation?lat=40.666&lng=-111.897")
-    test("GET /api/map/elevation", status == 200)
-    status, data = get("/api/map/enhanced?lat=40.666&lng=-111.897")
-    test("GET /api/map/enhanced", status == 200)
-
-
-def test_wildlife_endpoints():
+    test("GET /api/map/monarch-status", monarch[0] == 200)
+    test("GET /api/map/frost-dates", frost[0] == 200)
+    test("GET /api/map/waystations", waystations[0] == 200)
+    test("GET /api/map/bee-cities", bee_cities[0] == 200)
+    test("GET /api/map/corridors", corridors[0] == 200)
+    test("GET /api/map/parks", parks[0] == 200)
+    test("GET /api/map/elevation", elevation[0] == 200)
+    test("GET /api/map/enhanced", enhanced[0] == 200)
+
+
+async def test_wildlife_endpoints(client):
+    sources, motus, tracks, inat, gbif, unified = await asyncio.gather(
+        get(client, "/api/wildlife/sources"),
+        get(client, "/api/wildlife/motus"),
+        get(client, "/api/wildlife/motus/tracks"),
+        get(client, "/api/wildlife/inaturalist?lat=40.666&lng=-111.897&radius=10"),
+        get(client, "/api/wildlife/gbif?lat=40.666&lng=-111.897"),
+        get(client, "/api/wildlife/unified?lat=40.666&lng=-111.897&radius=10"),
+    )
     print("\n📋 Wildlife Data Endpoints")
-    status, data = get("/api/wildlife/sources")
+    status, data = sources
     test("GET /api/wildlife/sources", status == 200)
     test("Sources has sources array", isinstance(data, dict) and "sources" in data)
-    status, data = get("/api/wildlife/motus")
+    status, data = motus
     test("GET /api/wildlife/motus", status == 200)
     test("Motus has stations", isinstance(data, dict) and "stations" in data)
-    status, data = get("/api/wildlife/motus/tracks")
-    test("GET /api/wildlife/motus/tracks", status == 200)
-    status, data = get("/api/wildlife/inaturalist?lat=40.666&lng=-111.897&radius=10")
+    test("GET /api/wildlife/motus/tracks", tracks[0] == 200)
+    status, data = inat
     test("GET /api/wildlife/inaturalist", status == 200)
     test("iNaturalist has observations", isinstance(data, dict) and "observations" in data)
-    status, data = get("/api/wildlife/gbif?lat=40.666&lng=-111.897")
-    test("GET /api/wildlife/gbif", status == 200)
-    status, data = get("/api/wildlife/unified?lat=40.666&lng=-111.897&radius=10")
+    test("GET /api/wildlife/gbif", gbif[0] == 200)
+    status, data = unified
     test("GET /api/wildlife/unified", status == 200)
     test("Unified has features", isinstance(data, dict) and "features" in data)
 
@@ -217,6 +245,24 @@ def print_summary():
     return results["failed"] == 0
 
 
+async def run_all():
+    async with httpx.AsyncClient(base_url=BASE_URL, http2=True, timeout=30) as client:
+        await asyncio.gather(
+            test_health(client),
+            test_public_endpoints(client),
+            test_scoring_endpoints(client),
+            test_admin_endpoints(client),
+            test_jobs_endpoints(client),
+            test_stats_endpoints(client),
+            test_events_endpoints(client),
+            test_government_endpoints(client),
+            test_external_data_endpoints(client),
+            test_unified_map_endpoints(client),
+            test_enhanced_map_endpoints(client),
+            test_wildlife_endpoints(client),
+        )
+
+
 if __name__ == "__main__":
     print("=" * 50)
     print("🧪 Utah Pollinator Path - API Test Suite")
@@ -224,19 +270,7 @@ if __name__ == "__main__":
     print("=" * 50)
     
     start = time.time()
-    
-    test_health()
-    test_public_endpoints()
-    test_scoring_endpoints()
-    test_admin_endpoints()
-    test_jobs_endpoints()
-    test_stats_endpoints()
-    test_events_endpoints()
-    test_government_endpoints()
-    test_external_data_endpoints()
-    test_unified_map_endpoints()
-    test_enhanced_map_endpoints()
-    test_wildlife_endpoints()
+    asyncio.run(run_all())
     
     elapsed = time.time() - start
     print(f"\n⏱️  Completed in {elapsed:.1f}s")
@@ -0,0 +1,80 @@
+"""
+Offline tests for core.engine.CacheManager.
+Run: python -m pytest tests
+"""
+
+import core.engine
+from core.engine import CacheManager, Location
+
+
+def loc(i):
+    return Location(lat=40 + i * 0.01, lng=-111.0)
+
+
+def test_evicts_least_recently_used():
+    cache = CacheManager(max_entries=2)
+    cache.set("src", loc(0), {"v": 0})
+    cache.set("src", loc(1), {"v": 1})
+    assert cache.get("src", loc(0)) == {"v": 0}  # 0 is now most recent
+    cache.set("src", loc(2), {"v": 2})
+    
+    assert cache.get("src", loc(1)) is None
+    assert cache.get("src", loc(0)) == {"v": 0}
+    assert cache.get("src", loc(2)) == {"v": 2}
+    assert cache.stats["evictions"] == 1
+
+
+def test_overwrite_does_not_evict():
+    cache = CacheManager(max_entries=2)
+    cache.set("src", loc(0), {"v": 0})
+    cache.set("src", loc(1), {"v": 1})
+    cache.set("src", loc(0), {"v": 10})
+    assert cache.get("src", loc(0)) == {"v": 10}
+    assert cache.get("src", loc(1)) == {"v": 1}
+    assert cache.stats["evictions"] == 0
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(core.engine.time, "monotonic", lambda: now[0])
+    cache = CacheManager(ttl_hours=1)
+    cache.set("src", loc(0), {"v": 0})
+    cache.set("src", loc(1), {"v": 1}, ttl_seconds=10)
+    
+    now[0] += 11
+    assert cache.get("src", loc(1)) is None
+    assert cache.get("src", loc(0)) == {"v": 0}
+    
+    now[0] += 3600
+    assert cache.get("src", loc(0)) is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_concurrent_writers_and_readers_respect_max_entries():
+    import sys
+    import threading
+    
+    cache = CacheManager(max_entries=8)
+    locations = [loc(i) for i in range(32)]
+    errors = []
+    
+    def worker(offset):
+        try:
+            for i in range(3000):
+                cache.set("src", locations[(i * 7 + offset) % 32], {"v": i})
+                cache.get("src", locations[(i + offset) % 32])
+        except Exception as e:  # pragma: no cover - the failure being tested for
+            errors.append(e)
+    
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads often enough to interleave writes
+    try:
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert not errors
+    assert len(cache._cache) <= 8
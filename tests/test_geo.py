@@ -0,0 +1,55 @@
+"""
+Offline tests for core.geo.
+Run: python -m pytest tests
+"""
+
+import numpy as np
+
+from core.geo import (
+    haversine_a,
+    haversine_m,
+    indices_within_radius,
+    radius_to_a,
+    within_bbox,
+)
+
+SLC = (40.7608, -111.8910)
+
+
+def random_points(n=5000, seed=3):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(40.0, 41.5, n), rng.uniform(-112.6, -111.2, n)
+
+
+def test_haversine_a_orders_like_distance():
+    lat, lng = random_points()
+    a = haversine_a(lat, lng, *SLC)
+    d = haversine_m(lat, lng, *SLC)
+    np.testing.assert_array_equal(np.argsort(a, kind="stable"), np.argsort(d, kind="stable"))
+
+
+def test_radius_to_a_threshold_matches_distance():
+    lat, lng = random_points()
+    for radius in (500.0, 5000.0, 40000.0):
+        by_a = haversine_a(lat, lng, *SLC) <= radius_to_a(radius)
+        by_m = haversine_m(lat, lng, *SLC) <= radius
+        assert (by_a != by_m).sum() == 0
+
+
+def test_within_bbox_never_drops_a_match():
+    lat, lng = random_points()
+    for radius in (500.0, 5000.0, 40000.0):
+        inside = haversine_m(lat, lng, *SLC) <= radius
+        assert not (inside & ~within_bbox(lat, lng, *SLC, radius)).any()
+
+
+def test_within_bbox_handles_antimeridian_and_poles():
+    assert within_bbox(0.0, -179.99, 0.0, 179.99, 5000.0)
+    assert within_bbox(89.99, 120.0, 89.95, -60.0, 20000.0)
+
+
+def test_indices_within_radius_matches_brute_force():
+    lat, lng = random_points()
+    radius = 10000.0
+    expected = np.flatnonzero(haversine_m(lat, lng, *SLC) <= radius)
+    np.testing.assert_array_equal(indices_within_radius(lat, lng, *SLC, radius), expected)
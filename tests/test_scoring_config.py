@@ -0,0 +1,58 @@
+"""
+Offline tests for scoring_config.
+Run: python -m pytest tests
+"""
+
+import numpy as np
+import pytest
+
+from scoring_config import (
+    ACTIVE_MODEL_VERSION,
+    COVERAGE_TIERS,
+    GROUND_TIERS,
+    get_active_model,
+    get_model,
+    lookup_tier,
+)
+
+
+def test_active_model_is_read_only():
+    active = get_active_model()
+    with pytest.raises(TypeError):
+        active["weights"]["floral"] = 0
+    with pytest.raises(TypeError):
+        active["floral_config"]["diversity_tiers"][0]["points"] = 0
+    assert sum(active["weights"].values()) == 100
+
+
+def test_get_model_returns_plain_config():
+    model = get_model(ACTIVE_MODEL_VERSION)
+    assert type(model["weights"]) is dict
+    assert type(model["floral_config"]["diversity_tiers"]) is list
+    assert dict(get_active_model()["weights"]) == model["weights"]
+
+
+def test_lookup_tier_scalar_boundaries():
+    # COVERAGE_TIERS: 5 -> 2, 10 -> 4, 20 -> 6, 30 -> 8
+    assert lookup_tier(0, COVERAGE_TIERS) == 0
+    assert lookup_tier(4.99, COVERAGE_TIERS) == 0
+    assert lookup_tier(5, COVERAGE_TIERS) == 2
+    assert lookup_tier(19.99, COVERAGE_TIERS) == 4
+    assert lookup_tier(30, COVERAGE_TIERS) == 8
+    assert lookup_tier(1000, COVERAGE_TIERS) == 8
+
+
+def test_lookup_tier_default_below_first_threshold():
+    assert lookup_tier(0, GROUND_TIERS, default=3) == 3
+    assert lookup_tier(1, GROUND_TIERS, default=3) == 3
+    assert lookup_tier(50, GROUND_TIERS, default=3) == 10
+
+
+def test_lookup_tier_scalar_returns_python_number():
+    assert type(lookup_tier(12, COVERAGE_TIERS)) is int
+
+
+def test_lookup_tier_array_matches_scalar():
+    values = np.array([0, 4.99, 5, 9.99, 10, 20, 29.99, 30, 100])
+    got = lookup_tier(values, GROUND_TIERS, default=3)
+    np.testing.assert_array_equal(got, [lookup_tier(v, GROUND_TIERS, default=3) for v in values])
@@ -0,0 +1,178 @@
+"""
+Offline tests for scoring_v2.
+Run: python -m pytest tests
+"""
+
+import random
+
+import numpy as np
+import orjson
+
+from scoring_v2 import (
+    SEASON_BITS,
+    PlantInventory,
+    PropertyData,
+    ScoreBreakdown,
+    Season,
+    properties_frame,
+    recommendations_batch,
+    score_properties_batch,
+    score_property,
+    score_totals_batch,
+)
+
+# Values on, just below and just above the tier thresholds
+COVERAGE = [0, 4.99, 5, 9.99, 10, 20, 29.99, 30, 100]
+BARE_SQFT = [0, 0.5, 1, 9.99, 10, 25, 49.99, 50, 200]
+NEIGHBORS = [0, 1, 2, 3, 4, 5, 9]
+GREEN = [0, 4.99, 5, 10, 20, 29.99, 30, 80]
+IMPERVIOUS = [0, 22, 22.01, 30, 50.57, 51, 80, 100]
+
+
+def make_corpus(n=600, seed=7):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        plants = [
+            PlantInventory(
+                f"sp{j}",
+                rng.randint(0, 6),  # 0 covers milkweed planted but not counted
+                [s for s in Season if rng.random() < 0.4],
+                rng.random() < 0.7,
+                rng.random() < 0.2,
+            )
+            for j in range(rng.randint(0, 14))
+        ]
+        out.append(PropertyData(
+            lat=40 + rng.random(), lng=-111 - rng.random(), plants=plants,
+            estimated_flower_coverage_pct=rng.choice(COVERAGE),
+            has_bare_ground=rng.random() < 0.5, bare_ground_sqft=rng.choice(BARE_SQFT),
+            has_dead_wood=rng.random() < 0.5, has_brush_pile=rng.random() < 0.5,
+            has_bee_hotel=rng.random() < 0.5, leaves_stems_over_winter=rng.random() < 0.5,
+            neighbors_in_program=rng.choice(NEIGHBORS),
+            green_space_within_500m=rng.choice(GREEN),
+            uses_pesticides=rng.random() < 0.5,
+            pesticide_frequency=rng.choice(["never", "rarely", "sometimes", "often", "daily"]),
+            mowing_frequency=rng.choice(["weekly", "biweekly", "monthly", "rarely", "never"]),
+            lot_size_sqft=rng.choice([5000, 8000]),
+            impervious_surface_pct=rng.choice(IMPERVIOUS),
+        ))
+    return out
+
+
+CORPUS = make_corpus()
+FRAME = properties_frame(CORPUS)
+SCALAR = [score_property(p) for p in CORPUS]
+
+
+def test_batch_matches_scalar():
+    batch = score_properties_batch(FRAME)
+    for i, expected in enumerate(SCALAR):
+        got = ScoreBreakdown.from_batch(batch, i)
+        got.recommendations = expected.recommendations
+        assert got == expected, i
+
+
+def test_totals_batch_matches_scalar():
+    totals = score_totals_batch(FRAME)
+    for column in totals.columns:
+        expected = np.array([getattr(b, column) for b in SCALAR], dtype=np.float64)
+        np.testing.assert_array_equal(totals[column].to_numpy(), expected, err_msg=column)
+
+
+def test_batch_accepts_frequency_labels():
+    labelled = FRAME.copy()
+    labelled["mowing_frequency"] = [p.mowing_frequency.label for p in CORPUS]
+    labelled["pesticide_frequency"] = [p.pesticide_frequency.label for p in CORPUS]
+    assert score_properties_batch(labelled).equals(score_properties_batch(FRAME))
+
+
+def test_recommendations_batch_matches_scalar():
+    recs = recommendations_batch(FRAME, score_properties_batch(FRAME))
+    assert recs == [b.recommendations for b in SCALAR]
+
+
+def test_memoized_results_are_independent_copies():
+    data = PropertyData(lat=0, lng=0)
+    first = score_property(data)
+    first.final_score = -1
+    first.recommendations.clear()
+    
+    second = score_property(PropertyData(lat=1, lng=1))
+    assert second is not first
+    assert second.final_score != -1
+    assert second.recommendations
+
+
+def test_scoring_records_are_slotted():
+    plant = PlantInventory("Rabbitbrush", 2, [Season.FALL], True)
+    for obj in (plant, PropertyData(lat=0, lng=0, plants=[plant]), SCALAR[0]):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+
+def test_season_masks_match_bloom_seasons():
+    for data in CORPUS:
+        seasons = {s for p in data.plants for s in p.bloom_seasons}
+        for season, bit in SEASON_BITS.items():
+            assert bool(data._season_mask & bit) == (season in seasons)
+        for p in data.plants:
+            assert p._bloom_mask == sum(SEASON_BITS[s] for s in set(p.bloom_seasons))
+
+
+def test_from_dict_json_payload_parses_seasons():
+    payload = orjson.loads(b"""{
+        "lat": 40.6655, "lng": -111.8965,
+        "plants": [
+            {"species": "Rabbitbrush", "count": 2, "bloom_seasons": ["fall"], "is_native": true},
+            {"species": "Showy Milkweed", "count": 3, "bloom_seasons": ["summer", "winter"],
+             "is_native": true, "is_milkweed": true}
+        ],
+        "mowing_frequency": "monthly"
+    }""")
+    data = PropertyData.from_dict(payload)
+    
+    assert data.plants[0].bloom_seasons == [Season.FALL]
+    assert data.plants[1].bloom_seasons == [Season.SUMMER]  # unknown label dropped
+    
+    result = score_property(data)
+    assert result.floral_fall == 6
+    assert result.floral_summer == 2
+    assert "September Nectar Gap" not in [r["title"] for r in result.recommendations]
+
+
+def test_to_dict_is_plain_and_json_serializable():
+    import json
+    
+    result = score_property(PropertyData(lat=0, lng=0))
+    d = result.to_dict()
+    assert all(type(r) is dict for r in d["recommendations"])
+    assert json.loads(json.dumps(d)) == orjson.loads(result.to_json_bytes())
+    
+    d["recommendations"][0]["title"] = "changed"
+    assert score_property(PropertyData(lat=0, lng=0)).recommendations[0]["title"] != "changed"
+
+
+def test_memo_cache_survives_concurrent_eviction(monkeypatch):
+    import threading
+    from collections import OrderedDict
+    
+    import scoring_v2
+    
+    monkeypatch.setattr(scoring_v2, "_PROPERTY_CACHE_MAX", 4)
+    monkeypatch.setattr(scoring_v2, "_property_cache", OrderedDict())
+    errors = []
+    
+    def worker(offset):
+        try:
+            for i in range(2000):
+                score_property(CORPUS[(i + offset) % 12])
+        except Exception as e:  # pragma: no cover - the failure being tested for
+            errors.append(e)
+    
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert len(scoring_v2._property_cache) <= 4